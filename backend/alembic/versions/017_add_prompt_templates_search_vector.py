@@ -0,0 +1,43 @@
+"""add full-text search vector to prompt_templates
+
+Adiciona coluna gerada search_vector (tsvector) em prompt_templates, com
+indice GIN, para busca textual indexada em nome, descricao e conteudo.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # --- prompt_templates: coluna tsvector gerada (STORED) ---
+    # Mantida pelo proprio PostgreSQL a cada INSERT/UPDATE
+    op.execute(sa.text(
+        'ALTER TABLE prompt_templates ADD COLUMN search_vector tsvector '
+        'GENERATED ALWAYS AS ('
+        "to_tsvector('simple', "
+        "coalesce(name, '') || ' ' || "
+        "coalesce(description, '') || ' ' || "
+        "coalesce(content, ''))"
+        ') STORED'
+    ))
+
+    # --- prompt_templates: indice GIN para consultas @@ ---
+    op.execute(sa.text(
+        'CREATE INDEX ix_prompt_templates_search_vector '
+        'ON prompt_templates USING gin (search_vector)'
+    ))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_prompt_templates_search_vector', table_name='prompt_templates')
+    op.drop_column('prompt_templates', 'search_vector')
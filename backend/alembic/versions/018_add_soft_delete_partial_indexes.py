@@ -0,0 +1,57 @@
+"""add partial indexes for non-deleted rows
+
+Indices parciais (WHERE deleted_at IS NULL) para as listagens das tabelas
+com soft delete. Como toda consulta ORM filtra deleted_at IS NULL, esses
+indices cobrem apenas as linhas vivas e continuam pequenos mesmo com o
+acumulo de registros excluidos.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # --- jobs: listagem geral e por projeto, ordenadas por created_at DESC ---
+    op.execute(
+        'CREATE INDEX ix_jobs_alive_created_at '
+        'ON jobs (created_at DESC) WHERE deleted_at IS NULL'
+    )
+    op.execute(
+        'CREATE INDEX ix_jobs_alive_project_id_created_at '
+        'ON jobs (project_id, created_at DESC) WHERE deleted_at IS NULL'
+    )
+
+    # --- projects: listagem ordenada por created_at DESC ---
+    op.execute(
+        'CREATE INDEX ix_projects_alive_created_at '
+        'ON projects (created_at DESC) WHERE deleted_at IS NULL'
+    )
+
+    # --- delivery_configs: configuracoes de um job ---
+    op.execute(
+        'CREATE INDEX ix_delivery_configs_alive_job_id_created_at '
+        'ON delivery_configs (job_id, created_at DESC) WHERE deleted_at IS NULL'
+    )
+
+    # --- prompt_templates: listagem ordenada por created_at DESC ---
+    op.execute(
+        'CREATE INDEX ix_prompt_templates_alive_created_at '
+        'ON prompt_templates (created_at DESC) WHERE deleted_at IS NULL'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_prompt_templates_alive_created_at', table_name='prompt_templates')
+    op.drop_index('ix_delivery_configs_alive_job_id_created_at', table_name='delivery_configs')
+    op.drop_index('ix_projects_alive_created_at', table_name='projects')
+    op.drop_index('ix_jobs_alive_project_id_created_at', table_name='jobs')
+    op.drop_index('ix_jobs_alive_created_at', table_name='jobs')
@@ -15,6 +15,9 @@ engine = create_engine(
     max_overflow=10,
     pool_recycle=1800,
     pool_timeout=30,
+    # Cache de SQL compilado maior que o padrao (500) para acomodar as
+    # variacoes de filtros das listagens sem recompilar statements.
+    query_cache_size=1200,
     echo=False,
 )
 
@@ -33,9 +36,26 @@ class Base(DeclarativeBase):
 
 
 def get_db() -> Generator[Session, None, None]:
-    """Dependency do FastAPI que fornece uma sessao do banco de dados."""
+    """
+    Dependency do FastAPI que fornece uma sessao do banco de dados.
+
+    A sessao funciona como unidade de trabalho da requisicao: faz commit
+    uma unica vez ao final se o endpoint terminar com sucesso, e rollback
+    se uma excecao for propagada. Repositorios podem usar flush() para
+    enviar escritas sem encerrar a transacao.
+
+    Deve ser declarada como Depends(get_db, scope='function'): assim o
+    commit termina antes de a resposta ser enviada (no escopo padrao
+    'request' ele rodaria depois, e o cliente receberia 2xx mesmo com
+    falha no commit). Todas as declaracoes usam o mesmo escopo para
+    compartilhar a mesma sessao na requisicao.
+    """
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
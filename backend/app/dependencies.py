@@ -20,7 +20,7 @@ def get_storage_client() -> StorageClient:
 
 def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope='function'),
 ) -> User:
     """
     Dependency que valida o token JWT e retorna o usuario autenticado.
@@ -1,3 +1,4 @@
+import asyncio
 import re
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
@@ -10,6 +11,7 @@ from app.config import settings
 from app.database import SessionLocal
 from app.shared.exceptions import (
     BadRequestException,
+    ConflictException,
     ForbiddenException,
     NotFoundException,
     UnauthorizedException,
@@ -22,6 +24,7 @@ from app.shared.logging import (
     setup_logging,
     user_id_var,
 )
+from app.shared.schemas import build_deferred_schemas
 from app.modules.audit.repository import AuditLogRepository
 from app.modules.audit.service import AuditLogService
 from app.modules.auth.service import decode_token
@@ -116,6 +119,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Gerencia o ciclo de vida da aplicacao (startup/shutdown)."""
     # Startup: verifica configuracoes de seguranca
     _check_security_settings()
+    # Compila os schemas com defer_build antes da primeira requisicao
+    build_deferred_schemas()
     logger.info(
         'AgentVision API v1.0.0 iniciada. CORS origens: %s',
         settings.cors_origins,
@@ -330,6 +335,16 @@ async def bad_request_exception_handler(
     )
 
 
+@app.exception_handler(ConflictException)
+async def conflict_exception_handler(
+    request: Request, exc: ConflictException
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=409,
+        content={'success': False, 'message': str(exc)},
+    )
+
+
 # -------------------------------------------------------------------------
 # Routers dos modulos
 # -------------------------------------------------------------------------
@@ -435,7 +450,8 @@ async def api_health_check() -> dict:
         start = time.monotonic()
         from app.shared.storage import StorageClient
         storage = StorageClient()
-        storage._client.head_bucket(Bucket=storage._bucket)
+        # Chamada boto3 bloqueante: executa em thread para nao travar o event loop
+        await asyncio.to_thread(storage._client.head_bucket, Bucket=storage._bucket)
         latency = round((time.monotonic() - start) * 1000, 1)
         components['minio'] = {
             'status': 'healthy',
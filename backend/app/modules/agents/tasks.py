@@ -55,7 +55,6 @@ def check_llm_providers_health() -> dict:
             db.query(Project)
             .filter(
                 Project.is_active.is_(True),
-                Project.deleted_at.is_(None),
             )
             .all()
         )
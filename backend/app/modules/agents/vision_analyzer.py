@@ -834,13 +834,9 @@ class VisionAnalyzer:
             AnalysisResult se encontrado no cache, None caso contrario.
         """
         try:
-            from redis import Redis
+            from app.shared.redis_client import get_redis_client
 
-            from app.config import settings
-
-            redis_client = Redis.from_url(
-                settings.redis_url, decode_responses=True,
-            )
+            redis_client = get_redis_client()
             cached = redis_client.get(cache_key)
             if cached:
                 data = json.loads(cached)
@@ -869,13 +865,9 @@ class VisionAnalyzer:
             result: Resultado da analise para cachear.
         """
         try:
-            from redis import Redis
+            from app.shared.redis_client import get_redis_client
 
-            from app.config import settings
-
-            redis_client = Redis.from_url(
-                settings.redis_url, decode_responses=True,
-            )
+            redis_client = get_redis_client()
             cache_data = json.dumps({
                 'text': result.text,
                 'extracted_data': result.extracted_data,
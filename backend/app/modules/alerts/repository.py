@@ -19,7 +19,7 @@ class AlertRuleRepository:
 
     def get_all(self, include_inactive: bool = False) -> list[AlertRule]:
         """Retorna todas as regras nao excluidas."""
-        stmt = select(AlertRule).where(AlertRule.deleted_at.is_(None))
+        stmt = select(AlertRule)
         if not include_inactive:
             stmt = stmt.where(AlertRule.is_active.is_(True))
         stmt = stmt.order_by(AlertRule.created_at.desc())
@@ -29,7 +29,6 @@ class AlertRuleRepository:
         """Busca regra por ID (nao excluida)."""
         stmt = select(AlertRule).where(
             AlertRule.id == rule_id,
-            AlertRule.deleted_at.is_(None),
         )
         return self._db.execute(stmt).scalar_one_or_none()
 
@@ -27,7 +27,7 @@ router = APIRouter(
 )
 
 
-def get_alert_service(db: Session = Depends(get_db)) -> AlertService:
+def get_alert_service(db: Session = Depends(get_db, scope='function')) -> AlertService:
     """Dependency que fornece o servico de alertas."""
     return AlertService(db)
 
@@ -15,7 +15,7 @@ router = APIRouter(
 )
 
 
-def get_audit_repository(db: Session = Depends(get_db)) -> AuditLogRepository:
+def get_audit_repository(db: Session = Depends(get_db, scope='function')) -> AuditLogRepository:
     return AuditLogRepository(db)
 
 
@@ -33,3 +33,4 @@ class AuditLogListParams(BaseModel):
 
 
 AuditLogListResponse = PaginatedResponse[AuditLogResponse]
+AuditLogListResponse.model_rebuild()
@@ -2,8 +2,7 @@ import uuid
 from datetime import datetime
 
 from app.modules.audit.repository import AuditLogRepository
-from app.modules.audit.schemas import AuditLogResponse
-from app.shared.schemas import PaginatedResponse
+from app.modules.audit.schemas import AuditLogListResponse, AuditLogResponse
 
 
 class AuditLogService:
@@ -43,7 +42,7 @@ class AuditLogService:
         user_id: uuid.UUID | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
-    ) -> PaginatedResponse[AuditLogResponse]:
+    ) -> AuditLogListResponse:
         """Lista logs de auditoria com filtros."""
         logs, total = self._repository.list(
             page=page,
@@ -55,7 +54,7 @@ class AuditLogService:
             date_to=date_to,
         )
         items = [AuditLogResponse.model_validate(log) for log in logs]
-        return PaginatedResponse[AuditLogResponse].create(
+        return AuditLogListResponse.create(
             items=items,
             total=total,
             page=page,
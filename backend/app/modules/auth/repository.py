@@ -32,7 +32,6 @@ class UserRepository:
         """
         stmt = select(User).where(
             User.email == email,
-            User.deleted_at.is_(None),
         )
         return self._db.execute(stmt).scalar_one_or_none()
 
@@ -48,7 +47,6 @@ class UserRepository:
         """
         stmt = select(User).where(
             User.id == user_id,
-            User.deleted_at.is_(None),
         )
         return self._db.execute(stmt).scalar_one_or_none()
 
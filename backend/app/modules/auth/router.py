@@ -90,13 +90,13 @@ def _safe_audit(audit_service: AuditLogService, **kwargs) -> None:
         pass
 
 
-def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
+def get_user_repository(db: Session = Depends(get_db, scope='function')) -> UserRepository:
     """Dependency que fornece o repositorio de usuarios."""
     return UserRepository(db)
 
 
 def get_auth_service(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope='function'),
 ) -> AuthService:
     """Dependency que fornece o servico de autenticacao."""
     repository = UserRepository(db)
@@ -104,7 +104,7 @@ def get_auth_service(
     return AuthService(repository, token_repository)
 
 
-def get_audit_service(db: Session = Depends(get_db)) -> AuditLogService:
+def get_audit_service(db: Session = Depends(get_db, scope='function')) -> AuditLogService:
     """Dependency que fornece o servico de auditoria."""
     return AuditLogService(AuditLogRepository(db))
 
@@ -24,7 +24,7 @@ router = APIRouter(
 )
 
 
-def get_dashboard_service(db: Session = Depends(get_db)) -> DashboardService:
+def get_dashboard_service(db: Session = Depends(get_db, scope='function')) -> DashboardService:
     """Dependency que fornece o servico do dashboard."""
     return DashboardService(db)
 
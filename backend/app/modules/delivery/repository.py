@@ -36,7 +36,6 @@ class DeliveryRepository:
         """
         stmt = select(DeliveryConfig).where(
             DeliveryConfig.job_id == job_id,
-            DeliveryConfig.deleted_at.is_(None),
         ).order_by(DeliveryConfig.created_at.desc())
 
         return list(self._db.execute(stmt).scalars().all())
@@ -53,7 +52,6 @@ class DeliveryRepository:
         """
         stmt = select(DeliveryConfig).where(
             DeliveryConfig.job_id == job_id,
-            DeliveryConfig.deleted_at.is_(None),
             DeliveryConfig.is_active.is_(True),
         ).order_by(DeliveryConfig.created_at.desc())
 
@@ -71,7 +69,6 @@ class DeliveryRepository:
         """
         stmt = select(DeliveryConfig).where(
             DeliveryConfig.id == config_id,
-            DeliveryConfig.deleted_at.is_(None),
         )
         return self._db.execute(stmt).scalar_one_or_none()
 
@@ -27,7 +27,7 @@ router = APIRouter(
 # -------------------------------------------------------------------------
 
 
-def get_delivery_repository(db: Session = Depends(get_db)) -> DeliveryRepository:
+def get_delivery_repository(db: Session = Depends(get_db, scope='function')) -> DeliveryRepository:
     """Dependency que fornece o repositorio de entregas."""
     return DeliveryRepository(db)
 
@@ -685,7 +685,6 @@ class DeliveryService:
 
             stmt = select(PromptTemplate).where(
                 PromptTemplate.id == template_id,
-                PromptTemplate.deleted_at.is_(None),
             )
             template = self._repository._db.execute(stmt).scalar_one_or_none()
             if template:
@@ -34,12 +34,14 @@ router = APIRouter(
 # -------------------------------------------------------------------------
 
 
-def get_execution_repository(db: Session = Depends(get_db)) -> ExecutionRepository:
+def get_execution_repository(
+    db: Session = Depends(get_db, scope='function'),
+) -> ExecutionRepository:
     """Dependency que fornece o repositorio de execucoes."""
     return ExecutionRepository(db)
 
 
-def get_delivery_repository(db: Session = Depends(get_db)) -> DeliveryRepository:
+def get_delivery_repository(db: Session = Depends(get_db, scope='function')) -> DeliveryRepository:
     """Dependency que fornece o repositorio de entregas."""
     return DeliveryRepository(db)
 
@@ -319,3 +319,4 @@ class PdfUrlResponse(BaseModel):
 
 # Alias para resposta paginada de execucoes
 ExecutionListResponse = PaginatedResponse[ExecutionListItemResponse]
+ExecutionListResponse.model_rebuild()
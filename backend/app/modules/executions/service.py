@@ -14,7 +14,6 @@ from app.modules.executions.schemas import (
     ScreenshotUrlResponse,
 )
 from app.shared.exceptions import BadRequestException, NotFoundException
-from app.shared.schemas import PaginatedResponse
 from app.shared.storage import StorageClient
 
 logger = logging.getLogger(__name__)
@@ -84,7 +83,7 @@ class ExecutionService:
             for execution in executions
         ]
 
-        return PaginatedResponse[ExecutionListItemResponse].create(
+        return ExecutionListResponse.create(
             items=execution_responses,
             total=total,
             page=page,
@@ -40,8 +40,9 @@ class JobRepository:
         Returns:
             Tupla com lista de jobs e total de registros.
         """
-        # Query base filtrando registros nao excluidos
-        stmt = select(Job).where(Job.deleted_at.is_(None))
+        # Query base (registros excluidos sao filtrados automaticamente;
+        # a contagem seleciona so uma coluna e precisa do filtro explicito)
+        stmt = select(Job)
         count_stmt = select(func.count(Job.id)).where(Job.deleted_at.is_(None))
 
         # Filtro por projeto
@@ -80,10 +81,7 @@ class JobRepository:
         Returns:
             Job encontrado ou None.
         """
-        stmt = select(Job).where(
-            Job.id == job_id,
-            Job.deleted_at.is_(None),
-        )
+        stmt = select(Job).where(Job.id == job_id)
         return self._db.execute(stmt).scalar_one_or_none()
 
     def get_by_project_id(self, project_id: uuid.UUID) -> list[Job]:
@@ -98,7 +96,6 @@ class JobRepository:
         """
         stmt = select(Job).where(
             Job.project_id == project_id,
-            Job.deleted_at.is_(None),
         ).order_by(Job.created_at.desc())
 
         return list(self._db.execute(stmt).scalars().all())
@@ -168,7 +165,6 @@ class JobRepository:
             Lista de jobs ativos.
         """
         stmt = select(Job).where(
-            Job.deleted_at.is_(None),
             Job.is_active.is_(True),
         ).order_by(Job.created_at.desc())
 
@@ -31,17 +31,17 @@ router = APIRouter(
 # -------------------------------------------------------------------------
 
 
-def get_job_repository(db: Session = Depends(get_db)) -> JobRepository:
+def get_job_repository(db: Session = Depends(get_db, scope='function')) -> JobRepository:
     """Dependency que fornece o repositorio de jobs."""
     return JobRepository(db)
 
 
-def get_project_repository(db: Session = Depends(get_db)) -> ProjectRepository:
+def get_project_repository(db: Session = Depends(get_db, scope='function')) -> ProjectRepository:
     """Dependency que fornece o repositorio de projetos."""
     return ProjectRepository(db)
 
 
-def get_delivery_repository(db: Session = Depends(get_db)) -> DeliveryRepository:
+def get_delivery_repository(db: Session = Depends(get_db, scope='function')) -> DeliveryRepository:
     """Dependency que fornece o repositorio de entregas."""
     return DeliveryRepository(db)
 
@@ -331,3 +331,4 @@ class DryRunResponse(BaseModel):
 
 # Alias para resposta paginada de jobs
 JobListResponse = PaginatedResponse[JobResponse]
+JobListResponse.model_rebuild()
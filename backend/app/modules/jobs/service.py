@@ -17,7 +17,6 @@ from app.modules.jobs.schemas import (
 )
 from app.modules.projects.repository import ProjectRepository
 from app.shared.exceptions import BadRequestException, NotFoundException
-from app.shared.schemas import PaginatedResponse
 from app.shared.utils import encrypt_dict, utc_now
 
 
@@ -48,7 +47,7 @@ class JobService:
         project_id: uuid.UUID | None = None,
         is_active: bool | None = None,
         search: str | None = None,
-    ) -> PaginatedResponse[JobResponse]:
+    ) -> JobListResponse:
         """
         Lista jobs com paginacao e filtros.
 
@@ -79,7 +78,7 @@ class JobService:
             for job in jobs
         ]
 
-        return PaginatedResponse[JobResponse].create(
+        return JobListResponse.create(
             items=job_responses,
             total=total,
             page=page,
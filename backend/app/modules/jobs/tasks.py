@@ -12,6 +12,7 @@ from redis import Redis
 from app.celery_app import celery_app
 from app.config import settings
 from app.database import SessionLocal
+from app.shared.redis_client import get_redis_client
 from app.shared.utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -78,8 +79,8 @@ class CriticalExecutionError(Exception):
 # ---------------------------------------------------------------------------
 
 def _get_redis_client() -> Redis:
-    """Retorna uma instancia do cliente Redis usando a URL das configuracoes."""
-    return Redis.from_url(settings.redis_url, decode_responses=True)
+    """Retorna um cliente Redis do pool compartilhado do processo."""
+    return get_redis_client()
 
 
 # ---------------------------------------------------------------------------
@@ -619,12 +620,17 @@ def execute_job(self, job_id: str, is_dry_run: bool = False) -> dict:
         # -----------------------------------------------------------------
         # 0b. Adquire lock distribuido para o job
         # -----------------------------------------------------------------
-        # Busca execution_params do job para calcular TTL do lock
+        # Busca execution_params do job para calcular TTL do lock. Inclui
+        # jobs excluidos (como antes do filtro automatico de soft delete):
+        # um job removido apos o enfileiramento e descartado no passo 1.
         from app.modules.jobs.models import Job as JobModel
+        from app.shared.models import INCLUDE_DELETED
         from sqlalchemy import select as sa_select
 
         stmt = sa_select(JobModel).where(JobModel.id == job_uuid)
-        job_for_ttl = db.execute(stmt).scalar_one_or_none()
+        job_for_ttl = db.execute(
+            stmt, execution_options={INCLUDE_DELETED: True},
+        ).scalar_one_or_none()
         execution_params_for_ttl = (
             dict(job_for_ttl.execution_params)
             if job_for_ttl and job_for_ttl.execution_params
@@ -38,9 +38,12 @@ class ProjectRepository:
         Returns:
             Tupla com lista de projetos e total de registros.
         """
-        # Query base filtrando registros nao excluidos
-        stmt = select(Project).where(Project.deleted_at.is_(None))
-        count_stmt = select(func.count(Project.id)).where(Project.deleted_at.is_(None))
+        # Query base (registros excluidos sao filtrados automaticamente;
+        # a contagem seleciona so uma coluna e precisa do filtro explicito)
+        stmt = select(Project)
+        count_stmt = select(func.count(Project.id)).where(
+            Project.deleted_at.is_(None)
+        )
 
         # Filtro por busca textual (nome ou descricao)
         if search:
@@ -79,10 +82,7 @@ class ProjectRepository:
         Returns:
             Projeto encontrado ou None.
         """
-        stmt = select(Project).where(
-            Project.id == project_id,
-            Project.deleted_at.is_(None),
-        )
+        stmt = select(Project).where(Project.id == project_id)
         return self._db.execute(stmt).scalar_one_or_none()
 
     def create(self, project_data: dict) -> Project:
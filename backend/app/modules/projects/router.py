@@ -27,7 +27,7 @@ router = APIRouter(
 # -------------------------------------------------------------------------
 
 
-def get_project_repository(db: Session = Depends(get_db)) -> ProjectRepository:
+def get_project_repository(db: Session = Depends(get_db, scope='function')) -> ProjectRepository:
     """Dependency que fornece o repositorio de projetos."""
     return ProjectRepository(db)
 
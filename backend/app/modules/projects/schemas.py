@@ -268,3 +268,4 @@ class ProjectResponse(BaseModel):
 
 # Alias para resposta paginada de projetos
 ProjectListResponse = PaginatedResponse[ProjectResponse]
+ProjectListResponse.model_rebuild()
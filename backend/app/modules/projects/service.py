@@ -10,7 +10,6 @@ from app.modules.projects.schemas import (
     ProjectUpdate,
 )
 from app.shared.exceptions import NotFoundException
-from app.shared.schemas import PaginatedResponse
 from app.shared.utils import decrypt_value, encrypt_value
 
 
@@ -32,7 +31,7 @@ class ProjectService:
         per_page: int = 20,
         search: str | None = None,
         is_active: bool | None = None,
-    ) -> PaginatedResponse[ProjectResponse]:
+    ) -> ProjectListResponse:
         """
         Lista projetos com paginacao e filtros.
 
@@ -56,7 +55,7 @@ class ProjectService:
             ProjectResponse.from_model(project) for project in projects
         ]
 
-        return PaginatedResponse[ProjectResponse].create(
+        return ProjectListResponse.create(
             items=project_responses,
             total=total,
             page=page,
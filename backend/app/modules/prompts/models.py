@@ -1,4 +1,5 @@
-from sqlalchemy import Integer, String, Text
+from sqlalchemy import Computed, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.shared.models import SoftDeleteModel
@@ -11,6 +12,8 @@ class PromptTemplate(SoftDeleteModel):
     Representa um template reutilizavel de prompt para os agentes de IA.
     Inclui versionamento automatico: a cada atualizacao, o campo version
     e incrementado.
+    A coluna search_vector (tsvector) e gerada pelo banco a partir de
+    nome, descricao e conteudo, e indexada com GIN para busca full-text.
     Herda de SoftDeleteModel (inclui id, created_at, updated_at, deleted_at).
     """
 
@@ -40,3 +43,13 @@ class PromptTemplate(SoftDeleteModel):
         nullable=False,
         default=1,
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(name, '') || ' ' || "
+            "coalesce(description, '') || ' ' || coalesce(content, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+        deferred=True,
+    )
@@ -1,7 +1,9 @@
 import uuid
+from collections.abc import Callable, Iterable
+from datetime import datetime
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, func, lambda_stmt, select, update
+from sqlalchemy.orm import Session, load_only, raiseload
 
 from app.modules.prompts.models import PromptTemplate
 from app.shared.utils import utc_now
@@ -13,63 +15,205 @@ class PromptTemplateRepository:
 
     Responsavel por operacoes de leitura e escrita na tabela prompt_templates.
     Nao contem logica de negocio — apenas acesso a dados.
+    Escritas usam flush(); o commit e feito uma unica vez por requisicao
+    pela dependency get_db.
     """
 
     def __init__(self, db: Session) -> None:
         """Inicializa o repositorio com a sessao do banco."""
         self._db = db
 
+    def _build_filters(
+        self,
+        search: str | None,
+        category: str | None,
+        search_fulltext: str | None,
+    ) -> list[Callable]:
+        """
+        Monta os filtros da listagem como lambdas para lambda_stmt.
+
+        Args:
+            search: Termo de busca para filtrar por nome ou descricao.
+            category: Filtro por categoria.
+            search_fulltext: Termo de busca full-text.
+
+        Returns:
+            Lista de lambdas que aplicam cada filtro ao statement.
+        """
+        filters: list[Callable] = []
+
+        # Filtro por busca textual (nome ou descricao)
+        if search:
+            search_filter = f'%{search}%'
+            filters.append(
+                lambda s: s.where(
+                    (PromptTemplate.name.ilike(search_filter))
+                    | (PromptTemplate.description.ilike(search_filter))
+                )
+            )
+
+        # Filtro por categoria
+        if category:
+            filters.append(lambda s: s.where(PromptTemplate.category == category))
+
+        # Busca full-text indexada (inclui o conteudo do template)
+        if search_fulltext:
+            filters.append(
+                lambda s: s.where(
+                    PromptTemplate.search_vector.op('@@')(
+                        func.plainto_tsquery('simple', search_fulltext)
+                    )
+                )
+            )
+
+        return filters
+
     def get_all(
         self,
         page: int = 1,
         per_page: int = 20,
         search: str | None = None,
         category: str | None = None,
-    ) -> tuple[list[PromptTemplate], int]:
+        include_content: bool = True,
+        search_fulltext: str | None = None,
+        total: int | None = None,
+    ) -> tuple[Iterable[PromptTemplate] | Iterable[Row], int]:
         """
         Busca todos os templates com paginacao e filtros.
 
+        Os templates sao retornados como um resultado em streaming
+        (yield_per), que deve ser consumido enquanto a sessao estiver aberta.
+        Com include_content=False, seleciona apenas as colunas do resumo e
+        retorna linhas (Row) em vez de entidades ORM.
+
         Args:
             page: Numero da pagina (1-indexed).
             per_page: Quantidade de itens por pagina.
             search: Termo de busca para filtrar por nome ou descricao.
             category: Filtro por categoria.
+            include_content: Se deve carregar o campo content.
+            search_fulltext: Termo de busca full-text (nome, descricao e
+                conteudo), via search_vector indexado com GIN.
+            total: Total ja conhecido (ex: via get_list_stats); evita a
+                query de contagem quando informado.
 
         Returns:
-            Tupla com lista de templates e total de registros.
+            Tupla com iteravel de templates e total de registros.
         """
-        # Query base filtrando registros nao excluidos
-        stmt = select(PromptTemplate).where(PromptTemplate.deleted_at.is_(None))
-        count_stmt = select(func.count(PromptTemplate.id)).where(
-            PromptTemplate.deleted_at.is_(None)
-        )
-
-        # Filtro por busca textual (nome ou descricao)
-        if search:
-            search_filter = f'%{search}%'
-            stmt = stmt.where(
-                (PromptTemplate.name.ilike(search_filter))
-                | (PromptTemplate.description.ilike(search_filter))
+        # Query base filtrando registros nao excluidos. Usa lambda_stmt para
+        # que o SQLAlchemy reaproveite a construcao e a compilacao do SQL entre
+        # chamadas com o mesmo formato de filtros (apenas os parametros mudam).
+        # O filtro de soft delete fica explicito: o hook de models.py nao se
+        # aplica a lambda_stmt.
+        if include_content:
+            # Carrega apenas as colunas da resposta e bloqueia lazy loads (N+1).
+            stmt = lambda_stmt(
+                lambda: select(PromptTemplate)
+                .options(
+                    load_only(
+                        PromptTemplate.id,
+                        PromptTemplate.name,
+                        PromptTemplate.content,
+                        PromptTemplate.description,
+                        PromptTemplate.category,
+                        PromptTemplate.version,
+                        PromptTemplate.created_at,
+                        PromptTemplate.updated_at,
+                        raiseload=True,
+                    ),
+                    raiseload('*'),
+                )
+                .where(PromptTemplate.deleted_at.is_(None))
             )
-            count_stmt = count_stmt.where(
-                (PromptTemplate.name.ilike(search_filter))
-                | (PromptTemplate.description.ilike(search_filter))
+        else:
+            # Projecao leve sem o TEXT content, sem hidratacao ORM
+            stmt = lambda_stmt(
+                lambda: select(
+                    PromptTemplate.id,
+                    PromptTemplate.name,
+                    PromptTemplate.description,
+                    PromptTemplate.category,
+                    PromptTemplate.version,
+                    PromptTemplate.created_at,
+                    PromptTemplate.updated_at,
+                ).where(PromptTemplate.deleted_at.is_(None))
             )
+        count_stmt = lambda_stmt(
+            lambda: select(func.count(PromptTemplate.id)).where(
+                PromptTemplate.deleted_at.is_(None)
+            )
+        )
 
-        # Filtro por categoria
-        if category:
-            stmt = stmt.where(PromptTemplate.category == category)
-            count_stmt = count_stmt.where(PromptTemplate.category == category)
+        # Filtros construidos uma unica vez e aplicados as duas queries
+        filters = self._build_filters(search, category, search_fulltext)
+        for apply_filter in filters:
+            stmt += apply_filter
+            count_stmt += apply_filter
 
-        # Contagem total
-        total: int = self._db.execute(count_stmt).scalar_one()
+        # Contagem total (omitida quando o chamador ja a possui)
+        if total is None:
+            total = self._db.execute(count_stmt).scalar_one()
 
         # Paginacao e ordenacao
         offset = (page - 1) * per_page
-        stmt = stmt.order_by(PromptTemplate.created_at.desc()).offset(offset).limit(per_page)
+        stmt += lambda s: (
+            s.order_by(PromptTemplate.created_at.desc()).offset(offset).limit(per_page)
+        )
+
+        # Streaming da pagina: evita materializar uma lista intermediaria
+        result = self._db.execute(
+            stmt,
+            execution_options={'yield_per': per_page},
+        )
+        return (result.scalars() if include_content else result), total
+
+    def get_list_stats(
+        self,
+        search: str | None = None,
+        category: str | None = None,
+        search_fulltext: str | None = None,
+    ) -> tuple[int, datetime | None]:
+        """
+        Retorna total e data da ultima alteracao dos templates filtrados.
+
+        Uma unica query agregada (count + max(updated_at)), usada para gerar
+        o ETag da listagem sem carregar os registros.
+
+        Args:
+            search: Termo de busca para filtrar por nome ou descricao.
+            category: Filtro por categoria.
+            search_fulltext: Termo de busca full-text.
+
+        Returns:
+            Tupla com total de registros e maior updated_at (ou None).
+        """
+        stmt = lambda_stmt(
+            lambda: select(
+                func.count(PromptTemplate.id),
+                func.max(PromptTemplate.updated_at),
+            ).where(PromptTemplate.deleted_at.is_(None))
+        )
+        for apply_filter in self._build_filters(search, category, search_fulltext):
+            stmt += apply_filter
 
-        templates: list[PromptTemplate] = list(self._db.execute(stmt).scalars().all())
-        return templates, total
+        total, last_modified = self._db.execute(stmt).one()
+        return total, last_modified
+
+    def get_updated_at(self, template_id: uuid.UUID) -> datetime | None:
+        """
+        Busca apenas a data da ultima alteracao de um template.
+
+        Args:
+            template_id: ID (UUID) do template.
+
+        Returns:
+            updated_at do template ou None se nao encontrado.
+        """
+        stmt = select(PromptTemplate.updated_at).where(
+            PromptTemplate.id == template_id,
+            PromptTemplate.deleted_at.is_(None),
+        )
+        return self._db.execute(stmt).scalar_one_or_none()
 
     def get_by_id(self, template_id: uuid.UUID) -> PromptTemplate | None:
         """
@@ -81,9 +225,10 @@ class PromptTemplateRepository:
         Returns:
             Template encontrado ou None.
         """
-        stmt = select(PromptTemplate).where(
-            PromptTemplate.id == template_id,
-            PromptTemplate.deleted_at.is_(None),
+        stmt = (
+            select(PromptTemplate)
+            .options(raiseload('*'))
+            .where(PromptTemplate.id == template_id)
         )
         return self._db.execute(stmt).scalar_one_or_none()
 
@@ -99,7 +244,7 @@ class PromptTemplateRepository:
         """
         template = PromptTemplate(**template_data)
         self._db.add(template)
-        self._db.commit()
+        self._db.flush()
         self._db.refresh(template)
         return template
 
@@ -121,10 +266,47 @@ class PromptTemplateRepository:
         for key, value in template_data.items():
             setattr(template, key, value)
 
-        self._db.commit()
+        self._db.flush()
         self._db.refresh(template)
         return template
 
+    def update_and_bump_version(
+        self,
+        template_id: uuid.UUID,
+        template_data: dict,
+        expected_version: int | None = None,
+    ) -> PromptTemplate | None:
+        """
+        Atualiza um template e incrementa a versao em um unico UPDATE atomico.
+
+        O incremento e feito no servidor (version = version + 1) com
+        RETURNING, evitando o SELECT previo e a perda de atualizacoes
+        concorrentes. Se expected_version for informado, a atualizacao so
+        ocorre quando a versao atual coincide (lock otimista).
+
+        Args:
+            template_id: ID (UUID) do template a ser atualizado.
+            template_data: Dicionario com os campos a atualizar.
+            expected_version: Versao esperada do template (opcional).
+
+        Returns:
+            Template atualizado ou None se nenhuma linha foi afetada
+            (template inexistente ou versao divergente).
+        """
+        stmt = (
+            update(PromptTemplate)
+            .where(
+                PromptTemplate.id == template_id,
+                PromptTemplate.deleted_at.is_(None),
+            )
+            .values(**template_data, version=PromptTemplate.version + 1)
+            .returning(PromptTemplate)
+        )
+        if expected_version is not None:
+            stmt = stmt.where(PromptTemplate.version == expected_version)
+
+        return self._db.execute(stmt).scalar_one_or_none()
+
     def soft_delete(self, template_id: uuid.UUID) -> bool:
         """
         Realiza soft delete de um template (define deleted_at).
@@ -140,7 +322,7 @@ class PromptTemplateRepository:
             return False
 
         template.deleted_at = utc_now()
-        self._db.commit()
+        self._db.flush()
         return True
 
     def count_all(self) -> int:
@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -11,9 +11,17 @@ from app.modules.prompts.schemas import (
     PromptTemplateCreate,
     PromptTemplateListResponse,
     PromptTemplateResponse,
+    PromptTemplateSummaryListResponse,
     PromptTemplateUpdate,
 )
 from app.modules.prompts.service import PromptTemplateService
+from app.shared.http_cache import (
+    has_conditional_headers,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    set_cache_headers,
+)
 from app.shared.schemas import MessageResponse
 
 router = APIRouter(
@@ -23,22 +31,18 @@ router = APIRouter(
 
 
 # -------------------------------------------------------------------------
-# Dependency injection chain: get_db -> repository -> service
+# Dependency injection chain: get_db -> service (repositorio criado inline)
 # -------------------------------------------------------------------------
-
-
-def get_prompt_template_repository(
-    db: Session = Depends(get_db),
-) -> PromptTemplateRepository:
-    """Dependency que fornece o repositorio de templates de prompt."""
-    return PromptTemplateRepository(db)
+# O repositorio e montado dentro da dependency do servico para evitar um
+# nivel extra de Depends: cada dependency sincrona e resolvida em threadpool,
+# e o FastAPI ja garante uma unica instancia por request.
 
 
 def get_prompt_template_service(
-    repository: PromptTemplateRepository = Depends(get_prompt_template_repository),
+    db: Session = Depends(get_db, scope='function'),
 ) -> PromptTemplateService:
     """Dependency que fornece o servico de templates de prompt."""
-    return PromptTemplateService(repository)
+    return PromptTemplateService(PromptTemplateRepository(db))
 
 
 # -------------------------------------------------------------------------
@@ -46,37 +50,93 @@ def get_prompt_template_service(
 # -------------------------------------------------------------------------
 
 
-@router.get('', response_model=PromptTemplateListResponse)
+@router.get(
+    '',
+    response_model=PromptTemplateListResponse | PromptTemplateSummaryListResponse,
+)
 def list_templates(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description='Numero da pagina'),
     per_page: int = Query(20, ge=1, le=100, description='Itens por pagina'),
     search: str | None = Query(None, description='Busca por nome ou descricao'),
     category: str | None = Query(None, description='Filtrar por categoria'),
+    search_fulltext: str | None = Query(
+        None,
+        description='Busca full-text em nome, descricao e conteudo',
+    ),
+    include_content: bool = Query(
+        True,
+        description='Inclui o conteudo completo de cada template (false = resumo)',
+    ),
     current_user: User = Depends(require_roles('admin', 'operator')),
     service: PromptTemplateService = Depends(get_prompt_template_service),
-) -> PromptTemplateListResponse:
+) -> PromptTemplateListResponse | PromptTemplateSummaryListResponse | Response:
     """
     Lista todos os templates de prompt com paginacao e filtros.
 
     Retorna uma lista paginada de templates, com opcao de filtrar
-    por nome/descricao e categoria.
+    por nome/descricao e categoria. search_fulltext usa o indice full-text
+    (inclui o conteudo). Com include_content=false, omite o conteudo dos
+    templates para reduzir o volume da resposta.
+
+    Suporta requisicoes condicionais via ETag: se a listagem nao mudou,
+    responde 304 sem carregar a pagina. Nao emite Last-Modified nem aceita
+    If-Modified-Since: excluir um template nao avanca max(updated_at), e
+    so o ETag (que inclui o total) detecta a mudanca.
     """
+    # Total + ultima alteracao em uma unica query (substitui a contagem)
+    total, last_modified = service.get_list_stats(
+        search=search,
+        category=category,
+        search_fulltext=search_fulltext,
+    )
+    etag = make_etag(
+        'prompts:list', total, last_modified,
+        page, per_page, search, category, search_fulltext, include_content,
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    set_cache_headers(response, etag)
     return service.list_templates(
         page=page,
         per_page=per_page,
         search=search,
         category=category,
+        include_content=include_content,
+        search_fulltext=search_fulltext,
+        total=total,
     )
 
 
 @router.get('/{template_id}', response_model=PromptTemplateResponse)
 def get_template(
     template_id: uuid.UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(require_roles('admin', 'operator')),
     service: PromptTemplateService = Depends(get_prompt_template_service),
-) -> PromptTemplateResponse:
-    """Retorna os dados de um template de prompt especifico."""
-    return service.get_template(template_id)
+) -> PromptTemplateResponse | Response:
+    """
+    Retorna os dados de um template de prompt especifico.
+
+    Suporta requisicoes condicionais (ETag / Last-Modified): se o template
+    nao mudou, responde 304 consultando apenas updated_at.
+    """
+    if has_conditional_headers(request):
+        last_modified = service.get_template_last_modified(template_id)
+        etag = make_etag('prompts:detail', template_id, last_modified)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+
+    template = service.get_template(template_id)
+    set_cache_headers(
+        response,
+        make_etag('prompts:detail', template_id, template.updated_at),
+        template.updated_at,
+    )
+    return template
 
 
 @router.post('', response_model=PromptTemplateResponse, status_code=201)
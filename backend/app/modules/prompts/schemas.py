@@ -85,6 +85,11 @@ class PromptTemplateUpdate(BaseModel):
         max_length=100,
         description='Nova categoria do template',
     )
+    expected_version: int | None = Field(
+        None,
+        ge=1,
+        description='Versao atual esperada (lock otimista; 409 se divergir)',
+    )
 
     @field_validator('content')
     @classmethod
@@ -126,5 +131,28 @@ class PromptTemplateResponse(BaseModel):
     updated_at: datetime
 
 
+class PromptTemplateSummaryResponse(BaseModel):
+    """
+    Schema de resposta resumida do template de prompt.
+
+    Omite o campo content (potencialmente grande) para listagens leves.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    description: str | None = None
+    category: str | None = None
+    version: int
+    created_at: datetime
+    updated_at: datetime
+
+
 # Alias para resposta paginada de templates
 PromptTemplateListResponse = PaginatedResponse[PromptTemplateResponse]
+PromptTemplateListResponse.model_rebuild()
+
+# Alias para resposta paginada resumida (sem content)
+PromptTemplateSummaryListResponse = PaginatedResponse[PromptTemplateSummaryResponse]
+PromptTemplateSummaryListResponse.model_rebuild()
@@ -1,13 +1,22 @@
 import uuid
+from datetime import datetime
+
+from pydantic import TypeAdapter
 
 from app.modules.prompts.repository import PromptTemplateRepository
 from app.modules.prompts.schemas import (
     PromptTemplateCreate,
+    PromptTemplateListResponse,
     PromptTemplateResponse,
+    PromptTemplateSummaryListResponse,
+    PromptTemplateSummaryResponse,
     PromptTemplateUpdate,
 )
-from app.shared.exceptions import NotFoundException
-from app.shared.schemas import PaginatedResponse
+from app.shared.exceptions import ConflictException, NotFoundException
+
+# Adapter reutilizado para validar a pagina inteira de templates de uma vez
+_LIST_ADAPTER = TypeAdapter(list[PromptTemplateResponse])
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[PromptTemplateSummaryResponse])
 
 
 class PromptTemplateService:
@@ -28,7 +37,13 @@ class PromptTemplateService:
         per_page: int = 20,
         search: str | None = None,
         category: str | None = None,
-    ) -> PaginatedResponse[PromptTemplateResponse]:
+        include_content: bool = True,
+        search_fulltext: str | None = None,
+        total: int | None = None,
+    ) -> (
+        PromptTemplateListResponse
+        | PromptTemplateSummaryListResponse
+    ):
         """
         Lista templates com paginacao e filtros.
 
@@ -37,6 +52,9 @@ class PromptTemplateService:
             per_page: Itens por pagina.
             search: Termo de busca (nome ou descricao).
             category: Filtro por categoria.
+            include_content: Se False, retorna o resumo sem o campo content.
+            search_fulltext: Termo de busca full-text (inclui conteudo).
+            total: Total ja conhecido (ex: via get_list_stats), se houver.
 
         Returns:
             Resposta paginada com lista de templates.
@@ -46,20 +64,75 @@ class PromptTemplateService:
             per_page=per_page,
             search=search,
             category=category,
+            include_content=include_content,
+            search_fulltext=search_fulltext,
+            total=total,
         )
 
-        template_responses = [
-            PromptTemplateResponse.model_validate(template)
-            for template in templates
-        ]
+        if not include_content:
+            return PromptTemplateSummaryListResponse.create(
+                items=_SUMMARY_LIST_ADAPTER.validate_python(
+                    templates,
+                    from_attributes=True,
+                ),
+                total=total,
+                page=page,
+                per_page=per_page,
+            )
+
+        template_responses = _LIST_ADAPTER.validate_python(
+            templates,
+            from_attributes=True,
+        )
 
-        return PaginatedResponse[PromptTemplateResponse].create(
+        return PromptTemplateListResponse.create(
             items=template_responses,
             total=total,
             page=page,
             per_page=per_page,
         )
 
+    def get_list_stats(
+        self,
+        search: str | None = None,
+        category: str | None = None,
+        search_fulltext: str | None = None,
+    ) -> tuple[int, datetime | None]:
+        """
+        Obtem total e ultima alteracao da listagem (base para o ETag).
+
+        Args:
+            search: Termo de busca (nome ou descricao).
+            category: Filtro por categoria.
+            search_fulltext: Termo de busca full-text (inclui conteudo).
+
+        Returns:
+            Tupla com total de templates e maior updated_at (ou None).
+        """
+        return self._repository.get_list_stats(
+            search=search,
+            category=category,
+            search_fulltext=search_fulltext,
+        )
+
+    def get_template_last_modified(self, template_id: uuid.UUID) -> datetime:
+        """
+        Obtem a data da ultima alteracao de um template (base para o ETag).
+
+        Args:
+            template_id: ID do template.
+
+        Returns:
+            Data da ultima alteracao do template.
+
+        Raises:
+            NotFoundException: Se o template nao for encontrado.
+        """
+        updated_at = self._repository.get_updated_at(template_id)
+        if updated_at is None:
+            raise NotFoundException('Template de prompt nao encontrado')
+        return updated_at
+
     def get_template(self, template_id: uuid.UUID) -> PromptTemplateResponse:
         """
         Busca um template pelo ID.
@@ -107,7 +180,9 @@ class PromptTemplateService:
         """
         Atualiza um template existente.
 
-        Incrementa automaticamente o campo version a cada atualizacao.
+        Incrementa automaticamente o campo version a cada atualizacao, em
+        um unico UPDATE atomico. Se expected_version for informado, aplica
+        lock otimista sobre a versao atual.
 
         Args:
             template_id: ID do template a ser atualizado.
@@ -118,33 +193,37 @@ class PromptTemplateService:
 
         Raises:
             NotFoundException: Se o template nao for encontrado.
+            ConflictException: Se expected_version divergir da versao atual.
         """
-        # Verifica se o template existe e obtem a versao atual
-        existing = self._repository.get_by_id(template_id)
-        if not existing:
-            raise NotFoundException('Template de prompt nao encontrado')
-
-        # Prepara dados de atualizacao (apenas campos fornecidos)
-        update_data: dict = {}
-
-        if data.content is not None:
-            update_data['content'] = data.content
-
-        if data.description is not None:
-            update_data['description'] = data.description
-
-        if data.category is not None:
-            update_data['category'] = data.category
+        # Prepara dados de atualizacao (apenas campos fornecidos e nao nulos),
+        # sem nenhum acesso ao banco
+        update_data: dict = {
+            key: value
+            for key, value in data.model_dump(
+                exclude_unset=True,
+                exclude={'expected_version'},
+            ).items()
+            if value is not None
+        }
 
-        # Se nao ha campos para atualizar, retorna o template atual
+        # Se nao ha campos para atualizar, nao incrementa a versao nem executa
+        # UPDATE; apenas retorna o template atual (exigido pelo contrato)
         if not update_data:
-            return PromptTemplateResponse.model_validate(existing)
+            return self.get_template(template_id)
 
-        # Incrementa a versao a cada atualizacao
-        update_data['version'] = existing.version + 1
-
-        template = self._repository.update(template_id, update_data)
+        # Atualiza e incrementa a versao atomicamente no banco
+        template = self._repository.update_and_bump_version(
+            template_id,
+            update_data,
+            expected_version=data.expected_version,
+        )
         if not template:
+            # Diferencia template inexistente de conflito de versao
+            if data.expected_version is not None and self._repository.get_by_id(template_id):
+                raise ConflictException(
+                    'O template foi alterado por outra requisicao. '
+                    'Recarregue os dados e tente novamente.'
+                )
             raise NotFoundException('Template de prompt nao encontrado')
 
         return PromptTemplateResponse.model_validate(template)
@@ -1,5 +1,8 @@
-from sqlalchemy import delete, select
-from sqlalchemy.orm import Session
+from datetime import datetime
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, raiseload
 
 from app.modules.settings.models import Setting
 
@@ -10,6 +13,8 @@ class SettingRepository:
 
     Responsavel por operacoes de leitura e escrita na tabela settings.
     Nao contem logica de negocio — apenas acesso a dados.
+    Escritas usam flush(); o commit e feito uma unica vez por requisicao
+    pela dependency get_db.
     """
 
     def __init__(self, db: Session) -> None:
@@ -26,7 +31,7 @@ class SettingRepository:
         Returns:
             Configuracao encontrada ou None.
         """
-        stmt = select(Setting).where(Setting.key == key)
+        stmt = select(Setting).options(raiseload('*')).where(Setting.key == key)
         return self._db.execute(stmt).scalar_one_or_none()
 
     def get_by_category(self, category: str) -> list[Setting]:
@@ -41,11 +46,32 @@ class SettingRepository:
         """
         stmt = (
             select(Setting)
+            .options(raiseload('*'))
             .where(Setting.category == category)
             .order_by(Setting.key)
         )
         return list(self._db.execute(stmt).scalars().all())
 
+    def get_category_stats(self, category: str) -> tuple[int, datetime | None]:
+        """
+        Retorna total e data da ultima alteracao das configuracoes da categoria.
+
+        Uma unica query agregada (count + max(updated_at)), usada para gerar
+        o ETag sem carregar nem descriptografar os valores.
+
+        Args:
+            category: Categoria das configuracoes (ex: smtp, general).
+
+        Returns:
+            Tupla com total de configuracoes e maior updated_at (ou None).
+        """
+        stmt = select(
+            func.count(Setting.id),
+            func.max(Setting.updated_at),
+        ).where(Setting.category == category)
+        total, last_modified = self._db.execute(stmt).one()
+        return total, last_modified
+
     def upsert(
         self,
         key: str,
@@ -56,8 +82,10 @@ class SettingRepository:
         """
         Cria ou atualiza uma configuracao (upsert).
 
-        Se a chave ja existe, atualiza o valor criptografado.
-        Caso contrario, cria um novo registro.
+        Usa INSERT ... ON CONFLICT (key) DO UPDATE ... RETURNING, em um unico
+        round-trip atomico. Se a chave ja existe, atualiza o valor
+        criptografado e a categoria; a descricao so e sobrescrita quando
+        informada.
 
         Args:
             key: Chave unica da configuracao.
@@ -68,29 +96,52 @@ class SettingRepository:
         Returns:
             Configuracao criada ou atualizada.
         """
-        existing = self.get_by_key(key)
-
-        if existing:
-            # Atualiza o valor existente
-            existing.encrypted_value = encrypted_value
-            existing.category = category
-            if description is not None:
-                existing.description = description
-            self._db.commit()
-            self._db.refresh(existing)
-            return existing
-        else:
-            # Cria nova configuracao
-            setting = Setting(
-                key=key,
-                encrypted_value=encrypted_value,
-                category=category,
-                description=description,
-            )
-            self._db.add(setting)
-            self._db.commit()
-            self._db.refresh(setting)
-            return setting
+        return self.upsert_many([
+            {
+                'key': key,
+                'encrypted_value': encrypted_value,
+                'category': category,
+                'description': description,
+            },
+        ])[0]
+
+    def upsert_many(self, rows: list[dict]) -> list[Setting]:
+        """
+        Cria ou atualiza varias configuracoes em um unico statement.
+
+        Cada item de rows deve conter as chaves key, encrypted_value,
+        category e description. As chaves devem ser unicas dentro do lote.
+
+        Args:
+            rows: Lista de dicionarios com os dados das configuracoes.
+
+        Returns:
+            Lista de configuracoes criadas ou atualizadas.
+        """
+        if not rows:
+            return []
+
+        stmt = insert(Setting).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Setting.key],
+            set_={
+                'encrypted_value': stmt.excluded.encrypted_value,
+                'category': stmt.excluded.category,
+                'description': func.coalesce(
+                    stmt.excluded.description,
+                    Setting.description,
+                ),
+                'updated_at': func.now(),
+            },
+        ).returning(Setting)
+
+        settings_list = list(
+            self._db.execute(
+                stmt,
+                execution_options={'populate_existing': True},
+            ).scalars().all()
+        )
+        return settings_list
 
     def delete_by_key(self, key: str) -> bool:
         """
@@ -107,5 +158,5 @@ class SettingRepository:
             return False
 
         self._db.delete(setting)
-        self._db.commit()
+        self._db.flush()
         return True
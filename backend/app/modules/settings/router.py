@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -13,6 +13,12 @@ from app.modules.settings.schemas import (
     SettingsGroupResponse,
 )
 from app.modules.settings.service import SettingService
+from app.shared.http_cache import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    set_cache_headers,
+)
 from app.shared.schemas import MessageResponse
 
 router = APIRouter(
@@ -22,22 +28,18 @@ router = APIRouter(
 
 
 # -------------------------------------------------------------------------
-# Dependency injection chain: get_db -> repository -> service
+# Dependency injection chain: get_db -> service (repositorio criado inline)
 # -------------------------------------------------------------------------
-
-
-def get_setting_repository(
-    db: Session = Depends(get_db),
-) -> SettingRepository:
-    """Dependency que fornece o repositorio de configuracoes."""
-    return SettingRepository(db)
+# O repositorio e montado dentro da dependency do servico para evitar um
+# nivel extra de Depends: cada dependency sincrona e resolvida em threadpool,
+# e o FastAPI ja garante uma unica instancia por request.
 
 
 def get_setting_service(
-    repository: SettingRepository = Depends(get_setting_repository),
+    db: Session = Depends(get_db, scope='function'),
 ) -> SettingService:
     """Dependency que fornece o servico de configuracoes."""
-    return SettingService(repository)
+    return SettingService(SettingRepository(db))
 
 
 # -------------------------------------------------------------------------
@@ -91,7 +93,7 @@ def update_log_levels(
 
 
 @router.post('/smtp/test', response_model=MessageResponse)
-def test_smtp_connection(
+async def test_smtp_connection(
     config: SMTPConfigSchema,
     current_user: User = Depends(require_roles('admin')),
     service: SettingService = Depends(get_setting_service),
@@ -99,10 +101,11 @@ def test_smtp_connection(
     """
     Testa a conexao SMTP com as configuracoes fornecidas.
 
-    Tenta conectar ao servidor SMTP, fazer login e desconectar.
+    Tenta conectar ao servidor SMTP, fazer login (se houver credenciais)
+    e desconectar, sem bloquear o event loop.
     Retorna sucesso ou falha com mensagem explicativa.
     """
-    success = service.test_smtp_connection(config)
+    success = await service.test_smtp_connection_async(config)
 
     if success:
         return MessageResponse(
@@ -119,14 +122,26 @@ def test_smtp_connection(
 @router.get('/{category}', response_model=SettingsGroupResponse)
 def get_settings_by_category(
     category: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(require_roles('admin')),
     service: SettingService = Depends(get_setting_service),
-) -> SettingsGroupResponse:
+) -> SettingsGroupResponse | Response:
     """
     Retorna todas as configuracoes de uma categoria com valores descriptografados.
 
     Categorias disponiveis: smtp, general.
+    Suporta requisicoes condicionais via ETag: o ETag vem do total e da
+    ultima alteracao da categoria (nunca dos valores), e o 304 e respondido
+    sem carregar nem descriptografar as configuracoes. Nao usa Last-Modified:
+    remover uma configuracao nao avanca max(updated_at).
     """
+    total, last_modified = service.get_category_stats(category)
+    etag = make_etag('settings', category, total, last_modified)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    set_cache_headers(response, etag)
     return service.get_settings(category)
 
 
@@ -140,7 +155,8 @@ def update_settings_by_category(
     """
     Atualiza configuracoes de uma categoria.
 
-    Cada par chave-valor e criptografado e salvo (upsert).
+    Cada par chave-valor e criptografado e salvo (upsert em lote).
     Se a chave ja existe, atualiza o valor. Caso contrario, cria nova entrada.
+    Retorna as configuracoes enviadas, com valores sensiveis mascarados.
     """
     return service.update_settings(category, data.settings)
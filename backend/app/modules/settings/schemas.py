@@ -2,10 +2,20 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.shared.security import sanitize_text
 
+# Configuracao comum dos schemas de entrada: o trim e feito pelo pydantic-core
+# antes das validacoes de tamanho (min_length passa a valer para o texto limpo)
+_INPUT_CONFIG = ConfigDict(str_strip_whitespace=True)
+
+# Niveis de log aceitos em LogLevelUpdate
+_VALID_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+_VALID_LEVELS_MSG = 'DEBUG, INFO, WARNING, ERROR, CRITICAL'
+
 
 class SettingCreate(BaseModel):
     """Schema para criacao de uma configuracao."""
 
+    model_config = _INPUT_CONFIG
+
     key: str = Field(
         ...,
         min_length=1,
@@ -28,28 +38,10 @@ class SettingCreate(BaseModel):
         description='Descricao da configuracao',
     )
 
-    @field_validator('key')
-    @classmethod
-    def key_sanitized(cls, v: str) -> str:
-        """Sanitiza chave."""
-        return sanitize_text(v)
-
-    @field_validator('value')
+    @field_validator('key', 'value', 'category', 'description')
     @classmethod
-    def value_sanitized(cls, v: str) -> str:
-        """Sanitiza valor."""
-        return sanitize_text(v)
-
-    @field_validator('category')
-    @classmethod
-    def category_sanitized(cls, v: str) -> str:
-        """Sanitiza categoria."""
-        return sanitize_text(v)
-
-    @field_validator('description')
-    @classmethod
-    def description_sanitized(cls, v: str | None) -> str | None:
-        """Sanitiza descricao."""
+    def fields_sanitized(cls, v: str | None) -> str | None:
+        """Sanitiza chave, valor, categoria e descricao."""
         if v is None:
             return v
         return sanitize_text(v)
@@ -58,6 +50,8 @@ class SettingCreate(BaseModel):
 class SettingUpdate(BaseModel):
     """Schema para atualizacao do valor de uma configuracao."""
 
+    model_config = _INPUT_CONFIG
+
     value: str = Field(
         ...,
         min_length=1,
@@ -106,6 +100,8 @@ class SettingsBulkUpdate(BaseModel):
     Recebe um dicionario com pares chave-valor a serem atualizados.
     """
 
+    model_config = _INPUT_CONFIG
+
     settings: dict[str, str] = Field(
         ...,
         description='Dicionario de configuracoes (chave -> valor)',
@@ -126,6 +122,8 @@ class SettingsBulkUpdate(BaseModel):
 class LogLevelUpdate(BaseModel):
     """Schema para atualizacao de log levels em runtime."""
 
+    model_config = _INPUT_CONFIG
+
     levels: dict[str, str] = Field(
         ...,
         description='Dicionario de modulo -> nivel (ex: {"app.modules.agents": "DEBUG"})',
@@ -135,14 +133,13 @@ class LogLevelUpdate(BaseModel):
     @classmethod
     def validate_levels(cls, v: dict[str, str]) -> dict[str, str]:
         """Valida que os niveis sao validos."""
-        valid_levels = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
         cleaned: dict[str, str] = {}
         for module, level in v.items():
             level_upper = level.strip().upper()
-            if level_upper not in valid_levels:
+            if level_upper not in _VALID_LEVELS:
                 raise ValueError(
                     f'Nivel invalido "{level}" para modulo "{module}". '
-                    f'Valores permitidos: {", ".join(sorted(valid_levels))}'
+                    f'Valores permitidos: {_VALID_LEVELS_MSG}'
                 )
             cleaned[sanitize_text(module.strip())] = level_upper
         return cleaned
@@ -162,6 +159,8 @@ class SMTPConfigSchema(BaseModel):
     Usado no endpoint de teste de conexao SMTP.
     """
 
+    model_config = _INPUT_CONFIG
+
     host: str = Field(
         ...,
         min_length=1,
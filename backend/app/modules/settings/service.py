@@ -1,14 +1,20 @@
 import logging
-import smtplib
+from datetime import datetime
+
+import aiosmtplib
 
 from app.modules.settings.repository import SettingRepository
 from app.modules.settings.schemas import SMTPConfigSchema, SettingsGroupResponse
-from app.shared.cache import cached, invalidate_cache
+from app.shared.cache import cached, invalidate_cache_after_commit
 from app.shared.security import mask_sensitive_dict
-from app.shared.utils import decrypt_value, encrypt_value
+from app.shared.utils import decrypt_many, encrypt_many
 
 logger = logging.getLogger(__name__)
 
+# Timeouts (segundos) do teste de conexao SMTP
+SMTP_TEST_CONNECT_TIMEOUT = 3.0
+SMTP_TEST_LOGIN_TIMEOUT = 5.0
+
 # Descricoes padrao para chaves SMTP
 SMTP_KEY_DESCRIPTIONS: dict[str, str] = {
     'smtp_host': 'Host do servidor SMTP',
@@ -32,7 +38,12 @@ class SettingService:
         """Inicializa o servico com o repositorio de configuracoes."""
         self._repository = repository
 
-    @cached(ttl=300, prefix='settings:category')
+    @cached(
+        ttl=60,
+        prefix='settings:group',
+        model=SettingsGroupResponse,
+        key_fn=lambda category: category,
+    )
     def get_settings(self, category: str) -> SettingsGroupResponse:
         """
         Obtem todas as configuracoes de uma categoria com valores descriptografados.
@@ -45,17 +56,21 @@ class SettingService:
         """
         settings_list = self._repository.get_by_category(category)
 
+        # Descriptografa o lote inteiro com uma unica instancia Fernet
+        decrypted_values = decrypt_many(
+            [setting.encrypted_value for setting in settings_list]
+        )
+
         decrypted_settings: dict[str, str] = {}
-        for setting in settings_list:
-            try:
-                decrypted_settings[setting.key] = decrypt_value(setting.encrypted_value)
-            except Exception:
+        for setting, decrypted in zip(settings_list, decrypted_values):
+            if decrypted is None:
                 # Se nao conseguir descriptografar, registra o erro mas nao expoe
                 logger.warning(
                     'Nao foi possivel descriptografar a configuracao: %s',
                     setting.key,
                 )
-                decrypted_settings[setting.key] = ''
+                decrypted = ''
+            decrypted_settings[setting.key] = decrypted
 
         # Mascara campos sensiveis antes de retornar
         masked = mask_sensitive_dict(decrypted_settings) or {}
@@ -65,36 +80,73 @@ class SettingService:
             settings=masked,
         )
 
+    def get_category_stats(self, category: str) -> tuple[int, datetime | None]:
+        """
+        Obtem total e ultima alteracao das configuracoes (base para o ETag).
+
+        Args:
+            category: Categoria das configuracoes.
+
+        Returns:
+            Tupla com total de configuracoes e maior updated_at (ou None).
+        """
+        return self._repository.get_category_stats(category)
+
     def update_settings(self, category: str, data: dict[str, str]) -> SettingsGroupResponse:
         """
-        Atualiza configuracoes de uma categoria (criptografa e faz upsert de cada chave).
+        Atualiza configuracoes de uma categoria (criptografa e faz upsert em lote).
+
+        Todas as chaves sao gravadas em um unico INSERT ... ON CONFLICT, e a
+        resposta e montada a partir das linhas retornadas (RETURNING), sem
+        uma nova leitura da categoria.
 
         Args:
             category: Categoria das configuracoes.
             data: Dicionario com pares chave-valor a serem atualizados.
 
         Returns:
-            Resposta com categoria e dicionario de configuracoes atualizadas.
+            Resposta com categoria e dicionario das configuracoes enviadas
+            (valores sensiveis mascarados).
         """
-        # Invalida cache da categoria antes de atualizar
-        invalidate_cache('settings:category')
-
-        # Obtem descricoes padrao para chaves conhecidas
-        for key, value in data.items():
-            if value == '****':
-                # Mantem valor existente quando o frontend envia mascara
-                continue
-            encrypted = encrypt_value(value)
-            description = SMTP_KEY_DESCRIPTIONS.get(key) if category == 'smtp' else None
-            self._repository.upsert(
-                key=key,
-                encrypted_value=encrypted,
-                category=category,
-                description=description,
-            )
+        # Mantem valor existente quando o frontend envia mascara
+        to_write = {key: value for key, value in data.items() if value != '****'}
+
+        # Criptografa o lote inteiro com uma unica instancia Fernet
+        encrypted_values = encrypt_many(list(to_write.values()))
+
+        # Monta as linhas do upsert (descricoes padrao para chaves conhecidas)
+        rows: list[dict] = [
+            {
+                'key': key,
+                'encrypted_value': encrypted,
+                'category': category,
+                'description': SMTP_KEY_DESCRIPTIONS.get(key) if category == 'smtp' else None,
+            }
+            for key, encrypted in zip(to_write, encrypted_values)
+        ]
+
+        # Upsert de todas as chaves em um unico statement
+        upserted = self._repository.upsert_many(rows)
+
+        # Invalida o cache somente apos o commit (feito por get_db): antes
+        # dele, uma leitura concorrente ainda veria os valores antigos e os
+        # gravaria de novo no cache
+        invalidate_cache_after_commit(self._repository._db, 'settings:group')
+
+        # Valores em texto puro ja sao conhecidos: dispensa SELECT + decrypt.
+        # Chaves enviadas com mascara mantem o valor existente ('****').
+        updated: dict[str, str] = {
+            key: value for key, value in data.items() if value == '****'
+        }
+        for setting in upserted:
+            updated[setting.key] = data[setting.key]
+
+        masked = mask_sensitive_dict(dict(sorted(updated.items()))) or {}
 
-        # Retorna as configuracoes atualizadas
-        return self.get_settings(category)
+        return SettingsGroupResponse(
+            category=category,
+            settings=masked,
+        )
 
     def get_smtp_config(self) -> dict[str, str]:
         """
@@ -107,11 +159,13 @@ class SettingService:
         settings_response = self.get_settings('smtp')
         return settings_response.settings
 
-    def test_smtp_connection(self, config: SMTPConfigSchema) -> bool:
+    async def test_smtp_connection_async(self, config: SMTPConfigSchema) -> bool:
         """
-        Testa a conexao SMTP com as configuracoes fornecidas.
+        Testa a conexao SMTP com as configuracoes fornecidas (assincrono).
 
-        Tenta conectar ao servidor SMTP, fazer login e desconectar.
+        Conecta ao servidor, envia EHLO e, se use_tls, faz STARTTLS.
+        O login so e tentado quando usuario e senha sao informados;
+        sem credenciais, a conexao bem-sucedida ja e considerada sucesso.
 
         Args:
             config: Configuracoes SMTP para teste.
@@ -119,23 +173,32 @@ class SettingService:
         Returns:
             True se a conexao foi bem-sucedida, False caso contrario.
         """
+        client = aiosmtplib.SMTP(
+            hostname=config.host,
+            port=config.port,
+            timeout=SMTP_TEST_CONNECT_TIMEOUT,
+            start_tls=False,
+        )
         try:
-            if config.use_tls:
-                with smtplib.SMTP(config.host, config.port, timeout=10) as server:
-                    server.ehlo()
-                    server.starttls()
-                    server.ehlo()
-                    server.login(config.username, config.password)
-            else:
-                with smtplib.SMTP(config.host, config.port, timeout=10) as server:
-                    server.ehlo()
-                    if config.username and config.password:
-                        server.login(config.username, config.password)
+            await client.connect()
+            try:
+                await client.ehlo()
+                if config.use_tls:
+                    await client.starttls()
+                    await client.ehlo()
+                if config.username and config.password:
+                    await client.login(
+                        config.username,
+                        config.password,
+                        timeout=SMTP_TEST_LOGIN_TIMEOUT,
+                    )
+            finally:
+                client.close()
 
             logger.info('Teste de conexao SMTP bem-sucedido para %s:%d', config.host, config.port)
             return True
 
-        except smtplib.SMTPAuthenticationError:
+        except aiosmtplib.SMTPAuthenticationError:
             logger.warning(
                 'Falha de autenticacao SMTP para %s:%d',
                 config.host,
@@ -143,7 +206,7 @@ class SettingService:
             )
             return False
 
-        except smtplib.SMTPException as e:
+        except aiosmtplib.SMTPException as e:
             logger.warning(
                 'Erro SMTP ao testar conexao %s:%d - %s',
                 config.host,
@@ -2,15 +2,23 @@
 Modulo de cache Redis para queries frequentes.
 
 Fornece o decorator @cached(ttl=N) para cachear resultados de funcoes,
-e funcoes auxiliares para invalidacao de cache por prefixo.
+mget_cached para leitura/escrita em lote e funcoes auxiliares para
+invalidacao de cache por prefixo (imediata ou apos o commit da sessao).
 """
 
 import functools
-import hashlib
 import json
 import logging
+import uuid
+from collections.abc import Callable, Iterable
+from datetime import date
 from typing import Any
 
+import orjson
+import xxhash
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
 from app.shared.redis_client import get_redis_client
 
 logger = logging.getLogger(__name__)
@@ -18,22 +26,92 @@ logger = logging.getLogger(__name__)
 # Prefixo global para todas as chaves de cache
 _CACHE_PREFIX = 'cache:'
 
+# Separador entre argumentos na chave (caractere de controle "unit separator")
+_KEY_SEPARATOR = b'\x1f'
+
+# Tags de tipo (primeiro caractere do valor armazenado).
+# Escalares sao gravados diretamente, sem passar pelo encoder JSON.
+_TAG_STR = 'S'
+_TAG_BOOL = 'B'
+_TAG_INT = 'I'
+_TAG_FLOAT = 'F'
+_TAG_JSON = 'J'
+
+# SCAN: quantidade de chaves examinadas por iteracao no servidor (nao afeta
+# o resultado, apenas reduz round-trips); UNLINK: chaves por comando
+_SCAN_COUNT = 2000
+_UNLINK_BATCH_SIZE = 1000
+
+# Aceita chaves nao-string (ex: int), como o json.dumps da stdlib
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _hash_key_data(data: bytes) -> str:
+    """Gera hash hexadecimal de 16 caracteres (xxh3 de 64 bits)."""
+    return xxhash.xxh3_64_hexdigest(data)
+
 
 def _make_cache_key(prefix: str, args: tuple, kwargs: dict) -> str:
     """Gera chave de cache deterministica a partir de prefix + argumentos."""
-    # Serializa argumentos de forma deterministica
-    key_data = json.dumps({'a': [str(a) for a in args], 'k': {str(k): str(v) for k, v in sorted(kwargs.items())}}, sort_keys=True)
-    key_hash = hashlib.md5(key_data.encode()).hexdigest()[:16]
-    return f'{_CACHE_PREFIX}{prefix}:{key_hash}'
+    # Concatena os argumentos de forma deterministica (kwargs ordenados)
+    key_data = _KEY_SEPARATOR.join(
+        [str(a).encode() for a in args]
+        + [f'{k}={v}'.encode() for k, v in sorted(kwargs.items())]
+    )
+    return f'{_CACHE_PREFIX}{prefix}:{_hash_key_data(key_data)}'
+
 
+def _encode_value(value: Any) -> str:
+    """Serializa um valor para o cache, prefixado com a tag de tipo."""
+    # bool antes de int (bool e subclasse de int)
+    if isinstance(value, bool):
+        return f'{_TAG_BOOL}{int(value)}'
+    if isinstance(value, str):
+        return f'{_TAG_STR}{value}'
+    if isinstance(value, int):
+        return f'{_TAG_INT}{value}'
+    if isinstance(value, float):
+        return f'{_TAG_FLOAT}{value!r}'
+    payload = orjson.dumps(
+        value, default=_json_serializer, option=_ORJSON_OPTIONS,
+    ).decode()
+    return f'{_TAG_JSON}{payload}'
 
-def cached(ttl: int = 60, prefix: str | None = None):
+
+def _decode_value(raw: str) -> Any:
+    """Reconstroi um valor do cache a partir da tag de tipo."""
+    tag, payload = raw[:1], raw[1:]
+    if tag == _TAG_JSON:
+        return orjson.loads(payload)
+    if tag == _TAG_STR:
+        return payload
+    if tag == _TAG_INT:
+        return int(payload)
+    if tag == _TAG_BOOL:
+        return payload == '1'
+    if tag == _TAG_FLOAT:
+        return float(payload)
+    # Valor legado sem tag (gravado antes do formato atual)
+    return json.loads(raw)
+
+
+def cached(
+    ttl: int = 60,
+    prefix: str | None = None,
+    model: type | None = None,
+    key_fn: Callable[..., str] | None = None,
+):
     """
     Decorator que cacheia o resultado de uma funcao no Redis.
 
     Args:
         ttl: Tempo de vida do cache em segundos (default: 60).
         prefix: Prefixo customizado para a chave. Se None, usa nome da funcao.
+        model: Schema Pydantic do retorno. Se informado, o valor lido do cache
+            e reconstruido com model.model_validate (em vez de um dict).
+        key_fn: Funcao que recebe os argumentos da chamada (sem 'self') e
+            retorna o sufixo final da chave. Evita a serializacao e o hash
+            dos argumentos quando a chave e trivial.
 
     Uso:
         @cached(ttl=300, prefix='dashboard:summary')
@@ -44,40 +122,138 @@ def cached(ttl: int = 60, prefix: str | None = None):
     Para invalidacao manual, use invalidate_cache(prefix).
     """
     def decorator(func):
+        cache_prefix = prefix or f'{func.__module__}.{func.__qualname__}'
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            cache_prefix = prefix or f'{func.__module__}.{func.__qualname__}'
             # Ignora 'self' nos argumentos para metodos de instancia
             cache_args = args[1:] if args and hasattr(args[0], '__class__') else args
-            cache_key = _make_cache_key(cache_prefix, cache_args, kwargs)
+            if key_fn is not None:
+                cache_key = f'{_CACHE_PREFIX}{cache_prefix}:{key_fn(*cache_args, **kwargs)}'
+            else:
+                cache_key = _make_cache_key(cache_prefix, cache_args, kwargs)
 
+            # Uma unica aquisicao do cliente para leitura e escrita
             try:
                 redis = get_redis_client()
-                cached_value = redis.get(cache_key)
-                if cached_value is not None:
-                    return json.loads(cached_value)
             except Exception:
-                # Se Redis falhar, executa a funcao normalmente
-                logger.debug('Cache miss (Redis indisponivel) para %s', cache_key)
+                redis = None
+
+            if redis is not None:
+                try:
+                    cached_value = redis.get(cache_key)
+                except Exception:
+                    # Se Redis falhar, executa a funcao normalmente (sem SETEX)
+                    logger.debug('Cache miss (Redis indisponivel) para %s', cache_key)
+                    redis = None
+                    cached_value = None
+
+                if cached_value is not None:
+                    try:
+                        value = _decode_value(cached_value)
+                        return model.model_validate(value) if model is not None else value
+                    except Exception:
+                        # Valor invalido: recalcula e sobrescreve a entrada
+                        logger.debug('Valor de cache invalido para %s', cache_key)
 
             # Executa funcao original
             result = func(*args, **kwargs)
 
+            if redis is None:
+                return result
+
             # Armazena no cache
             try:
-                redis = get_redis_client()
-                serialized = json.dumps(result, default=_json_serializer)
-                redis.setex(cache_key, ttl, serialized)
+                redis.setex(cache_key, ttl, _encode_value(result))
             except Exception:
                 logger.debug('Falha ao salvar cache para %s', cache_key)
 
             return result
         # Expoe o prefixo para invalidacao
-        wrapper._cache_prefix = prefix or f'{func.__module__}.{func.__qualname__}'
+        wrapper._cache_prefix = cache_prefix
         return wrapper
     return decorator
 
 
+def mget_cached(
+    prefix: str,
+    keys: Iterable[str],
+    loader: Callable[[list[str]], dict[str, Any]],
+    ttl: int = 60,
+) -> list[Any]:
+    """
+    Busca varias entradas de cache em lote (um MGET + um pipeline de SETEX).
+
+    Substitui N chamadas individuais ao cache (2N round-trips ao Redis)
+    por apenas 2 round-trips, independente da quantidade de chaves.
+
+    Args:
+        prefix: Prefixo das chaves (o mesmo usado em invalidate_cache).
+        keys: Identificadores a buscar (ex: IDs de registros).
+        loader: Funcao que recebe a lista de identificadores ausentes no
+            cache e retorna um dict {identificador: valor}.
+        ttl: Tempo de vida em segundos das entradas gravadas.
+
+    Returns:
+        Lista de valores na mesma ordem de keys (None se o loader nao
+        retornar valor para o identificador).
+    """
+    keys = list(keys)
+    if not keys:
+        return []
+    cache_keys = [f'{_CACHE_PREFIX}{prefix}:{key}' for key in keys]
+
+    try:
+        redis = get_redis_client()
+        raw_values = redis.mget(cache_keys)
+    except Exception:
+        logger.debug('Cache miss em lote (Redis indisponivel) para "%s"', prefix)
+        redis = None
+        raw_values = [None] * len(keys)
+
+    results: list[Any] = [
+        _decode_value(raw) if raw is not None else None for raw in raw_values
+    ]
+    missing = [key for key, raw in zip(keys, raw_values) if raw is None]
+    if not missing:
+        return results
+
+    loaded = loader(missing)
+    for index, key in enumerate(keys):
+        if raw_values[index] is None:
+            results[index] = loaded.get(key)
+
+    if redis is not None and loaded:
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for key, value in loaded.items():
+                pipe.setex(f'{_CACHE_PREFIX}{prefix}:{key}', ttl, _encode_value(value))
+            pipe.execute()
+        except Exception:
+            logger.debug('Falha ao salvar cache em lote para "%s"', prefix)
+
+    return results
+
+
+def _unlink_matching(redis: Any, pattern: str) -> int:
+    """
+    Remove (UNLINK) as chaves que casam com o padrao, em lotes.
+
+    UNLINK libera a memoria em background no Redis (nao bloqueia como DEL)
+    e os lotes mantem o tamanho de cada comando limitado.
+    """
+    removed = 0
+    batch: list[str] = []
+    for key in redis.scan_iter(match=pattern, count=_SCAN_COUNT):
+        batch.append(key)
+        if len(batch) >= _UNLINK_BATCH_SIZE:
+            removed += redis.unlink(*batch)
+            batch.clear()
+    if batch:
+        removed += redis.unlink(*batch)
+    return removed
+
+
 def invalidate_cache(prefix: str) -> int:
     """
     Invalida todas as chaves de cache que correspondem ao prefixo.
@@ -90,38 +266,59 @@ def invalidate_cache(prefix: str) -> int:
     """
     try:
         redis = get_redis_client()
-        pattern = f'{_CACHE_PREFIX}{prefix}:*'
-        keys = list(redis.scan_iter(match=pattern, count=100))
-        if keys:
-            deleted = redis.delete(*keys)
+        deleted = _unlink_matching(redis, f'{_CACHE_PREFIX}{prefix}:*')
+        if deleted:
             logger.debug('Cache invalidado: %d chaves com prefixo "%s"', deleted, prefix)
-            return deleted
-        return 0
+        return deleted
     except Exception:
         logger.debug('Falha ao invalidar cache com prefixo "%s"', prefix)
         return 0
 
 
+# Chave em Session.info com os prefixos a invalidar no proximo commit
+_PENDING_INVALIDATIONS = 'cache_invalidate_prefixes'
+
+
+def invalidate_cache_after_commit(db: Session, prefix: str) -> None:
+    """
+    Agenda a invalidacao do prefixo para depois do commit da sessao.
+
+    Invalidar antes do commit permite que uma leitura concorrente ainda veja
+    as linhas antigas e as grave de novo no cache. Se a transacao for
+    desfeita (rollback), a invalidacao e descartada.
+
+    Args:
+        db: Sessao cuja transacao contem a escrita.
+        prefix: Prefixo das chaves a invalidar (ex: 'settings:group').
+    """
+    db.info.setdefault(_PENDING_INVALIDATIONS, set()).add(prefix)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_pending(session: Session) -> None:
+    """Executa as invalidacoes agendadas apos o commit."""
+    for prefix in sorted(session.info.pop(_PENDING_INVALIDATIONS, ())):
+        invalidate_cache(prefix)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_pending(session: Session) -> None:
+    """Descarta as invalidacoes agendadas de uma transacao desfeita."""
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
 def invalidate_all_cache() -> int:
     """Remove todas as chaves de cache."""
     try:
         redis = get_redis_client()
-        pattern = f'{_CACHE_PREFIX}*'
-        keys = list(redis.scan_iter(match=pattern, count=500))
-        if keys:
-            return redis.delete(*keys)
-        return 0
+        return _unlink_matching(redis, f'{_CACHE_PREFIX}*')
     except Exception:
         return 0
 
 
 def _json_serializer(obj: Any) -> Any:
     """Serializer customizado para JSON que suporta tipos comuns."""
-    import uuid
-    from datetime import date, datetime
-
-    if isinstance(obj, datetime):
-        return obj.isoformat()
+    # datetime e subclasse de date: um unico isinstance cobre ambos
     if isinstance(obj, date):
         return obj.isoformat()
     if isinstance(obj, uuid.UUID):
@@ -28,3 +28,11 @@ class BadRequestException(Exception):
     def __init__(self, message: str = 'Requisicao invalida') -> None:
         self.message = message
         super().__init__(self.message)
+
+
+class ConflictException(Exception):
+    """Excecao para conflito de estado do recurso (HTTP 409)."""
+
+    def __init__(self, message: str = 'Conflito de estado do recurso') -> None:
+        self.message = message
+        super().__init__(self.message)
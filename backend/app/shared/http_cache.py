@@ -0,0 +1,98 @@
+"""
+Utilitarios de cache HTTP (requisicoes condicionais).
+
+Fornece geracao de ETag, verificacao de If-None-Match / If-Modified-Since
+e escrita dos headers de validacao, permitindo que endpoints GET respondam
+304 Not Modified sem consultar o banco completo nem serializar o corpo.
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+# Clientes devem sempre revalidar (dados dependem de autenticacao)
+_CACHE_CONTROL = 'private, no-cache'
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Gera um ETag forte (entre aspas) a partir das partes informadas.
+
+    Usa blake2b com digest de 8 bytes — suficiente para validacao de cache.
+    """
+    raw = '\x1f'.join(str(part) for part in parts).encode('utf-8')
+    return f'"{hashlib.blake2b(raw, digest_size=8).hexdigest()}"'
+
+
+def has_conditional_headers(request: Request) -> bool:
+    """Indica se a requisicao possui If-None-Match ou If-Modified-Since."""
+    headers = request.headers
+    return 'if-none-match' in headers or 'if-modified-since' in headers
+
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> bool:
+    """
+    Verifica se o recurso nao foi modificado segundo os headers condicionais.
+
+    If-None-Match tem precedencia sobre If-Modified-Since (RFC 9110).
+
+    Args:
+        request: Requisicao HTTP recebida.
+        etag: ETag atual do recurso.
+        last_modified: Data da ultima modificacao do recurso (opcional).
+
+    Returns:
+        True se o cliente ja possui a versao atual do recurso.
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return '*' in candidates or etag in candidates
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # Datas HTTP sao sempre GMT; valor sem fuso (ex: '-0000' ou sem
+        # zona) e tratado como UTC para comparar com datas com fuso
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=UTC)
+        # Header HTTP tem precisao de segundos
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def set_cache_headers(
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> None:
+    """Escreve ETag, Last-Modified e Cache-Control na resposta."""
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = _CACHE_CONTROL
+    if last_modified is not None:
+        response.headers['Last-Modified'] = format_datetime(
+            last_modified.astimezone(UTC),
+            usegmt=True,
+        )
+
+
+def not_modified_response(
+    etag: str,
+    last_modified: datetime | None = None,
+) -> Response:
+    """Cria uma resposta 304 Not Modified com os headers de validacao."""
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, last_modified)
+    return response
@@ -6,8 +6,10 @@ correlation_id e log levels por modulo. Compativel com logging stdlib
 para que bibliotecas terceiras tambem emitam JSON.
 """
 
+import functools
 import logging
 import logging.config
+import re
 import uuid
 from contextvars import ContextVar
 
@@ -63,6 +65,18 @@ def add_service_name(
 # ---------------------------------------------------------------------------
 _runtime_log_levels: dict[str, str] = {}
 
+# Nome do nivel -> valor numerico do logging stdlib (calculado uma vez)
+_LEVEL_MAP: dict[str, int] = {
+    name: getattr(logging, name)
+    for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+}
+
+# Um par "modulo:NIVEL" delimitado por virgulas; pares invalidos nao casam
+_LEVELS_RE = re.compile(
+    r'(?:^|,)\s*([^:,\s]+)\s*:\s*(DEBUG|INFO|WARNING|ERROR|CRITICAL)\s*(?=,|$)',
+    re.IGNORECASE,
+)
+
 
 def parse_log_levels(log_levels_str: str) -> dict[str, str]:
     """
@@ -70,26 +84,17 @@ def parse_log_levels(log_levels_str: str) -> dict[str, str]:
 
     Formato: "app.modules.agents:DEBUG,app.modules.jobs:INFO"
     """
-    levels: dict[str, str] = {}
-    if not log_levels_str or not log_levels_str.strip():
-        return levels
-    for pair in log_levels_str.split(','):
-        pair = pair.strip()
-        if ':' not in pair:
-            continue
-        module, level = pair.rsplit(':', 1)
-        module = module.strip()
-        level = level.strip().upper()
-        if level in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'):
-            levels[module] = level
-    return levels
+    return {
+        match.group(1): match.group(2).upper()
+        for match in _LEVELS_RE.finditer(log_levels_str or '')
+    }
 
 
 def set_module_log_levels(levels: dict[str, str]) -> None:
     """Aplica log levels por modulo no logging stdlib."""
     for module_name, level_str in levels.items():
         module_logger = logging.getLogger(module_name)
-        module_logger.setLevel(getattr(logging, level_str))
+        module_logger.setLevel(_LEVEL_MAP[level_str])
 
 
 def update_runtime_log_levels(levels: dict[str, str]) -> None:
@@ -204,10 +209,14 @@ def setup_logging(
         set_module_log_levels(module_levels)
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     """
     Retorna um logger structlog com o nome do modulo.
 
+    Um unico logger por nome no processo. structlog devolve um proxy lazy,
+    entao e seguro chamar antes de setup_logging.
+
     Uso:
         logger = get_logger(__name__)
         logger.info('mensagem', extra_field='valor')
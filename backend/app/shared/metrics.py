@@ -5,22 +5,31 @@ Define contadores, histogramas e gauges para monitorar execucoes,
 tokens LLM, screenshots e estado dos workers.
 """
 
+import functools
+
 from prometheus_client import Counter, Gauge, Histogram
 
+from app.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
 # ---------------------------------------------------------------------------
 # Metricas de execucoes
 # ---------------------------------------------------------------------------
 
+# Sem label job_id: cada job criaria uma serie permanente no registro.
+# O job_id e registrado no log estruturado de track_execution_finished.
 EXECUTIONS_TOTAL = Counter(
     'agentvision_executions_total',
     'Total de execucoes por status',
-    ['status', 'job_id'],
+    ['status'],
 )
 
 EXECUTION_DURATION_SECONDS = Histogram(
     'agentvision_execution_duration_seconds',
     'Duracao das execucoes em segundos',
-    buckets=[10, 30, 60, 120, 300, 600, 1200, 1800, 3600],
+    # Buckets espacados logaritmicamente (~4x): menos series por scrape
+    buckets=[15, 60, 240, 900, 3600],
 )
 
 ACTIVE_EXECUTIONS = Gauge(
@@ -48,7 +57,7 @@ LLM_REQUEST_DURATION_SECONDS = Histogram(
     'agentvision_llm_request_duration_seconds',
     'Duracao das chamadas ao LLM em segundos',
     ['provider'],
-    buckets=[1, 2, 5, 10, 20, 30, 60, 120],
+    buckets=[0.5, 2, 8, 30, 120],
 )
 
 # ---------------------------------------------------------------------------
@@ -70,6 +79,39 @@ DELIVERIES_TOTAL = Counter(
     ['channel', 'status'],  # status: success/failed
 )
 
+# ---------------------------------------------------------------------------
+# Metricas filhas pre-vinculadas aos labels
+#
+# labels() faz lookup com lock no registro da metrica a cada chamada; as
+# combinacoes de labels sao poucas e estaveis, entao o filho e memoizado.
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=32)
+def _executions(status: str):
+    return EXECUTIONS_TOTAL.labels(status=status)
+
+
+@functools.lru_cache(maxsize=512)
+def _llm_tokens(provider: str, model: str, direction: str):
+    return LLM_TOKENS_TOTAL.labels(provider=provider, model=model, direction=direction)
+
+
+@functools.lru_cache(maxsize=256)
+def _llm_requests(provider: str, status: str):
+    return LLM_REQUESTS_TOTAL.labels(provider=provider, status=status)
+
+
+@functools.lru_cache(maxsize=128)
+def _llm_duration(provider: str):
+    return LLM_REQUEST_DURATION_SECONDS.labels(provider=provider)
+
+
+@functools.lru_cache(maxsize=128)
+def _deliveries(channel: str, status: str):
+    return DELIVERIES_TOTAL.labels(channel=channel, status=status)
+
+
 # ---------------------------------------------------------------------------
 # Helpers para instrumentar o codigo existente
 # ---------------------------------------------------------------------------
@@ -82,9 +124,15 @@ def track_execution_started(job_id: str) -> None:
 
 def track_execution_finished(job_id: str, status: str, duration_seconds: float) -> None:
     """Registra finalizacao de uma execucao."""
-    EXECUTIONS_TOTAL.labels(status=status, job_id=job_id).inc()
+    _executions(status).inc()
     EXECUTION_DURATION_SECONDS.observe(duration_seconds)
     ACTIVE_EXECUTIONS.dec()
+    logger.info(
+        'execution_finished',
+        job_id=job_id,
+        status=status,
+        duration_seconds=duration_seconds,
+    )
 
 
 def track_llm_tokens(
@@ -94,14 +142,14 @@ def track_llm_tokens(
     output_tokens: int,
 ) -> None:
     """Registra consumo de tokens LLM."""
-    LLM_TOKENS_TOTAL.labels(provider=provider, model=model, direction='input').inc(input_tokens)
-    LLM_TOKENS_TOTAL.labels(provider=provider, model=model, direction='output').inc(output_tokens)
+    _llm_tokens(provider, model, 'input').inc(input_tokens)
+    _llm_tokens(provider, model, 'output').inc(output_tokens)
 
 
 def track_llm_request(provider: str, status: str, duration: float) -> None:
     """Registra uma chamada ao LLM."""
-    LLM_REQUESTS_TOTAL.labels(provider=provider, status=status).inc()
-    LLM_REQUEST_DURATION_SECONDS.labels(provider=provider).observe(duration)
+    _llm_requests(provider, status).inc()
+    _llm_duration(provider).observe(duration)
 
 
 def track_screenshot_captured(count: int = 1) -> None:
@@ -111,4 +159,4 @@ def track_screenshot_captured(count: int = 1) -> None:
 
 def track_delivery(channel: str, status: str) -> None:
     """Registra entrega por canal."""
-    DELIVERIES_TOTAL.labels(channel=channel, status=status).inc()
+    _deliveries(channel, status).inc()
@@ -1,9 +1,15 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, StatementLambdaElement, event, func
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import (
+    Mapped,
+    ORMExecuteState,
+    Session,
+    mapped_column,
+    with_loader_criteria,
+)
 
 from app.database import Base
 
@@ -42,6 +48,8 @@ class SoftDeleteModel(BaseModel):
 
     Herda de BaseModel e adiciona o campo deleted_at.
     Quando deleted_at nao e nulo, o registro e considerado excluido.
+    Consultas ORM excluem esses registros automaticamente (ver
+    _exclude_soft_deleted).
     """
 
     __abstract__ = True
@@ -51,3 +59,55 @@ class SoftDeleteModel(BaseModel):
         nullable=True,
         default=None,
     )
+
+
+# Opcao de execucao que desativa o filtro automatico de soft delete:
+# db.execute(stmt, execution_options={INCLUDE_DELETED: True})
+INCLUDE_DELETED = 'include_deleted'
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _exclude_soft_deleted(state: ORMExecuteState) -> None:
+    """
+    Aplica deleted_at IS NULL as entidades consultadas com soft delete.
+
+    O criterio vale apenas para as entidades selecionadas por inteiro
+    (select(Job), db.query(Job)), inclusive em subqueries da mesma entidade.
+    Selects de colunas ou agregacoes (select(Job.name), func.count(Job.id)),
+    JOINs e cargas de relacionamento nao sao filtrados, para que registros
+    historicos continuem acessando pais excluidos (ex: o job de uma
+    execucao antiga). Essas consultas devem incluir deleted_at IS NULL
+    explicitamente quando precisarem ignorar registros excluidos.
+
+    Statements lambda_stmt sao ignorados: .options() resolve o lambda
+    para um Select com os parametros da primeira chamada, que passariam a
+    ser reutilizados nas seguintes. Esses statements devem incluir
+    deleted_at IS NULL explicitamente.
+    """
+    if (
+        not state.is_select
+        or isinstance(state.statement, StatementLambdaElement)
+        or state.is_column_load
+        or state.is_relationship_load
+        or state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        return
+
+    # dict preserva a ordem, mantendo estavel a chave de cache do statement
+    entities = dict.fromkeys(
+        description['entity']
+        for description in state.statement.column_descriptions
+        if description['expr'] is description['entity']
+    )
+    options = [
+        with_loader_criteria(
+            entity,
+            entity.deleted_at.is_(None),
+            include_aliases=True,
+            propagate_to_loaders=False,
+        )
+        for entity in entities
+        if isinstance(entity, type) and issubclass(entity, SoftDeleteModel)
+    ]
+    if options:
+        state.statement = state.statement.options(*options)
@@ -1,8 +1,29 @@
-from redis import Redis
+from redis import BlockingConnectionPool, Redis
 
 from app.config import settings
 
+# Maximo de conexoes abertas por processo (API ou worker)
+_MAX_CONNECTIONS = 50
+
+# Tempo maximo (segundos) aguardando uma conexao livre quando o pool esgota
+_POOL_TIMEOUT = 20
+
+# Pool compartilhado pelo processo. As conexoes sao abertas sob demanda e
+# reutilizadas entre chamadas; apos um fork (workers Celery) o redis-py
+# recria o pool automaticamente no processo filho.
+_POOL = BlockingConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=_MAX_CONNECTIONS,
+    timeout=_POOL_TIMEOUT,
+    decode_responses=True,
+)
+
 
 def get_redis_client() -> Redis:
-    """Retorna uma instancia do cliente Redis usando a URL das configuracoes."""
-    return Redis.from_url(settings.redis_url, decode_responses=True)
+    """
+    Retorna um cliente Redis ligado ao pool compartilhado do processo.
+
+    Criar o cliente e barato (nao abre conexao). close() apenas devolve a
+    conexao ao pool, sem encerrar as demais.
+    """
+    return Redis(connection_pool=_POOL)
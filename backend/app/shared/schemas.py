@@ -8,9 +8,15 @@ T = TypeVar('T')
 
 
 class BaseSchema(BaseModel):
-    """Schema base com campos padrao de resposta."""
+    """
+    Schema base com campos padrao de resposta.
 
-    model_config = ConfigDict(from_attributes=True)
+    defer_build adia a compilacao do validador ate o primeiro uso, para que
+    processos que apenas importam os schemas (workers) nao paguem o custo.
+    Na API, build_deferred_schemas() compila todos no startup.
+    """
+
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     id: uuid.UUID
     created_at: datetime
@@ -23,6 +29,26 @@ class SoftDeleteSchema(BaseSchema):
     deleted_at: datetime | None = None
 
 
+def build_deferred_schemas() -> int:
+    """
+    Compila BaseSchema e todas as suas subclasses (defer_build).
+
+    Evita que a primeira requisicao de cada worker da API pague a
+    compilacao dentro de model_validate.
+
+    Returns:
+        Quantidade de schemas compilados.
+    """
+    pending: list[type[BaseModel]] = [BaseSchema]
+    built = 0
+    while pending:
+        schema = pending.pop()
+        pending.extend(schema.__subclasses__())
+        schema.model_rebuild()
+        built += 1
+    return built
+
+
 class PaginationParams(BaseModel):
     """Parametros de paginacao para requisicoes."""
 
@@ -36,9 +62,15 @@ class PaginationParams(BaseModel):
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Resposta paginada generica."""
+    """
+    Resposta paginada generica.
+
+    defer_build evita compilar o schema da classe generica (T nao resolvido).
+    Cada modulo declara o alias parametrizado (ex: JobListResponse) e chama
+    model_rebuild() na importacao, compilando o validador uma unica vez.
+    """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
     items: list[T]
     total: int
@@ -54,9 +86,14 @@ class PaginatedResponse(BaseModel, Generic[T]):
         page: int,
         per_page: int,
     ) -> 'PaginatedResponse[T]':
-        """Cria uma resposta paginada calculando o total de paginas."""
+        """
+        Cria uma resposta paginada calculando o total de paginas.
+
+        Usa model_construct (sem revalidacao): os itens ja sao schemas de
+        resposta validados pelo service e os inteiros vem do servidor.
+        """
         total_pages = (total + per_page - 1) // per_page if per_page > 0 else 0
-        return cls(
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
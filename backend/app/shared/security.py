@@ -1,59 +1,80 @@
 import json
 import re
+from collections import deque
 from typing import Any
 
 # Regex para remover caracteres de controle ASCII
 _CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]')
 
-# Regex para caracteres potencialmente perigosos em nomes
-_DANGEROUS_NAME_CHARS_RE = re.compile(r'[<>"\'`\\]')
-
-# Chaves sensiveis para mascaramento
-_SENSITIVE_KEYS = (
-    'password',
-    'passwd',
-    'secret',
-    'token',
-    'api_key',
-    'access_key',
-    'private_key',
+# Mesma remocao via str.translate (mais rapido para textos ASCII longos;
+# para textos nao-ASCII o translate com dict e lento e o regex e usado)
+_CONTROL_TRANS = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f],
 )
 
-_COMMON_PASSWORDS: set[str] | None = None
+# Destinatarios de email: caracteres de controle e tambem CR/LF
+_EMAIL_TRANS = {**_CONTROL_TRANS, 0x0a: None, 0x0d: None}
 
+# Regexes dos requisitos de senha forte
+_UPPER_RE = re.compile(r'[A-Z]')
+_LOWER_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+_SPECIAL_RE = re.compile(r'[^A-Za-z0-9]')
 
-def _load_common_passwords() -> set[str]:
-    """
-    Carrega uma lista de senhas comuns.
+# Regex para caracteres removidos de nomes: caracteres de controle
+# (mesmo conjunto de _CONTROL_CHARS_RE) e caracteres potencialmente perigosos
+_NAME_DROP_RE = re.compile(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f<>"\'`\\]')
 
-    Usa uma lista interna combinada com sequencias numericas
-    para cobrir um conjunto amplo de senhas frequentes.
-    """
-    common: set[str] = {
-        'password', 'password1', 'password123', '123456', '123456789',
-        '12345678', '1234567', '1234567890', '111111', '000000',
-        'qwerty', 'qwerty123', 'abc123', 'iloveyou', 'letmein',
-        'welcome', 'admin', 'admin123', 'login', 'senha',
-        'qwertyuiop', '123123', '654321', '1q2w3e4r',
-        '1234', '12345', '1234567', '12345678', '123456789',
-        'monkey', 'dragon', 'football', 'baseball', 'master',
-        'shadow', 'sunshine', 'princess', 'trustno1', 'access',
-        'superman', 'batman', 'hello', 'freedom', 'whatever',
-        'qazwsx', 'qazwsx123', 'passw0rd', 'password!', 'senha123',
-    }
-
-    # Adiciona sequencias numericas comuns (000000 a 000999)
-    for i in range(1000):
-        common.add(f'{i:06d}')
-
-    return common
-
-
-def get_common_passwords() -> set[str]:
-    """Retorna a lista de senhas comuns (cacheada)."""
-    global _COMMON_PASSWORDS
-    if _COMMON_PASSWORDS is None:
-        _COMMON_PASSWORDS = _load_common_passwords()
+# Regex para colapsar sequencias de espacos em branco
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Chaves sensiveis para mascaramento, em uma unica busca case-insensitive
+# por substring (qualquer chave que contenha a palavra e mascarada)
+_SENSITIVE_KEY_RE = re.compile(
+    r'password|passwd|secret|token|api[_-]?key|access[_-]?key|private[_-]?key',
+    re.IGNORECASE,
+)
+
+# Contadores de tokens do LLM: contem 'token', mas nao sao segredos.
+# Lista explicita (em minusculas) para que o mascaramento falhe fechado.
+_TOKEN_COUNTER_KEYS = frozenset({
+    'candidates_token_count',
+    'completion_tokens',
+    'image_tokens',
+    'input_tokens',
+    'llm_max_tokens',
+    'max_tokens',
+    'max_tokens_per_day',
+    'output_tokens',
+    'prompt_token_count',
+    'prompt_tokens',
+    'text_tokens',
+    'token_budget',
+    'tokens_used',
+    'total_input_tokens',
+    'total_output_tokens',
+    'total_tokens',
+    'total_tokens_today',
+})
+
+# Senhas comuns: lista interna combinada com sequencias numericas
+# (000000 a 000999), construida uma unica vez na importacao do modulo
+_COMMON_PASSWORDS: frozenset[str] = frozenset({
+    'password', 'password1', 'password123', '123456', '123456789',
+    '12345678', '1234567', '1234567890', '111111', '000000',
+    'qwerty', 'qwerty123', 'abc123', 'iloveyou', 'letmein',
+    'welcome', 'admin', 'admin123', 'login', 'senha',
+    'qwertyuiop', '123123', '654321', '1q2w3e4r',
+    '1234', '12345',
+    'monkey', 'dragon', 'football', 'baseball', 'master',
+    'shadow', 'sunshine', 'princess', 'trustno1', 'access',
+    'superman', 'batman', 'hello', 'freedom', 'whatever',
+    'qazwsx', 'qazwsx123', 'passw0rd', 'password!', 'senha123',
+} | {f'{i:06d}' for i in range(1000)})
+
+
+def get_common_passwords() -> frozenset[str]:
+    """Retorna o conjunto de senhas comuns."""
     return _COMMON_PASSWORDS
 
 
@@ -63,6 +84,11 @@ def sanitize_text(value: str) -> str:
     """
     if value is None:
         return value
+    # Fast path: texto imprimivel nao contem caracteres de controle
+    if value.isprintable():
+        return value.strip()
+    if value.isascii():
+        return value.translate(_CONTROL_TRANS).strip()
     cleaned = _CONTROL_CHARS_RE.sub('', value)
     return cleaned.strip()
 
@@ -70,10 +96,13 @@ def sanitize_text(value: str) -> str:
 def sanitize_name(value: str) -> str:
     """
     Sanitiza nomes removendo caracteres perigosos e trim.
+
+    Remove controles e caracteres perigosos em uma unica passada e so
+    depois colapsa os espacos (um caractere removido entre dois espacos
+    nao pode deixar espaco duplo).
     """
-    cleaned = sanitize_text(value)
-    cleaned = _DANGEROUS_NAME_CHARS_RE.sub('', cleaned)
-    return re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _NAME_DROP_RE.sub('', value)
+    return _WHITESPACE_RE.sub(' ', cleaned).strip()
 
 
 def sanitize_email_recipient(value: str) -> str:
@@ -82,7 +111,9 @@ def sanitize_email_recipient(value: str) -> str:
     """
     if value is None:
         return value
-    cleaned = value.replace('\r', '').replace('\n', '').strip()
+    if value.isascii():
+        return value.translate(_EMAIL_TRANS).strip()
+    cleaned = value.replace('\r', '').replace('\n', '')
     return sanitize_text(cleaned)
 
 
@@ -94,50 +125,93 @@ def sanitize_string_list(values: list[str] | None) -> list[str] | None:
 
 
 def sanitize_string_dict(data: dict | None) -> dict | None:
-    """Sanitiza valores string dentro de um dict (recursivo)."""
+    """
+    Sanitiza valores string dentro de um dict (incluindo dicts aninhados).
+
+    Percorre a estrutura com uma fila de pares (origem, destino) em vez de
+    recursao: sem custo de frames Python nem limite de profundidade.
+    Cada dict de origem e copiado uma unica vez (por id), entao referencias
+    ciclicas reaproveitam a copia e o percurso sempre termina.
+    """
     if data is None:
         return None
     cleaned: dict = {}
-    for key, value in data.items():
-        if isinstance(value, str):
-            cleaned[key] = sanitize_text(value)
-        elif isinstance(value, dict):
-            cleaned[key] = sanitize_string_dict(value)
-        elif isinstance(value, list):
-            cleaned_list = []
-            for item in value:
-                if isinstance(item, str):
-                    cleaned_list.append(sanitize_text(item))
-                elif isinstance(item, dict):
-                    cleaned_list.append(sanitize_string_dict(item))
-                else:
-                    cleaned_list.append(item)
-            cleaned[key] = cleaned_list
-        else:
-            cleaned[key] = value
+    copies: dict[int, dict] = {id(data): cleaned}
+    pending: deque[tuple[dict, dict]] = deque([(data, cleaned)])
+
+    def _copy_of(source: dict) -> dict:
+        """Retorna a copia do dict, agendando-o na primeira ocorrencia."""
+        child = copies.get(id(source))
+        if child is None:
+            child = copies[id(source)] = {}
+            pending.append((source, child))
+        return child
+
+    while pending:
+        source, target = pending.popleft()
+        for key, value in source.items():
+            if isinstance(value, str):
+                target[key] = sanitize_text(value)
+            elif isinstance(value, dict):
+                target[key] = _copy_of(value)
+            elif isinstance(value, list):
+                cleaned_list = []
+                for item in value:
+                    if isinstance(item, str):
+                        cleaned_list.append(sanitize_text(item))
+                    elif isinstance(item, dict):
+                        cleaned_list.append(_copy_of(item))
+                    else:
+                        cleaned_list.append(item)
+                target[key] = cleaned_list
+            else:
+                target[key] = value
     return cleaned
 
 
+def _is_sensitive_key(key: str) -> bool:
+    """Indica se o valor da chave deve ser mascarado."""
+    return (
+        _SENSITIVE_KEY_RE.search(key) is not None
+        and key.lower() not in _TOKEN_COUNTER_KEYS
+    )
+
+
 def mask_sensitive_dict(data: dict | None) -> dict | None:
-    """Mascara chaves sensiveis em um dicionario."""
+    """
+    Mascara chaves sensiveis em um dicionario (incluindo dicts aninhados).
+
+    Percorre a estrutura com uma fila, como sanitize_string_dict (inclusive
+    a protecao contra referencias ciclicas).
+    """
     if data is None:
         return None
     masked: dict = {}
-    for key, value in data.items():
-        if any(s in key.lower() for s in _SENSITIVE_KEYS):
-            masked[key] = '****'
-        elif isinstance(value, dict):
-            masked[key] = mask_sensitive_dict(value)
-        elif isinstance(value, list):
-            cleaned_list = []
-            for item in value:
-                if isinstance(item, dict):
-                    cleaned_list.append(mask_sensitive_dict(item))
-                else:
-                    cleaned_list.append(item)
-            masked[key] = cleaned_list
-        else:
-            masked[key] = value
+    copies: dict[int, dict] = {id(data): masked}
+    pending: deque[tuple[dict, dict]] = deque([(data, masked)])
+
+    def _copy_of(source: dict) -> dict:
+        """Retorna a copia do dict, agendando-o na primeira ocorrencia."""
+        child = copies.get(id(source))
+        if child is None:
+            child = copies[id(source)] = {}
+            pending.append((source, child))
+        return child
+
+    while pending:
+        source, target = pending.popleft()
+        for key, value in source.items():
+            if _is_sensitive_key(key):
+                target[key] = '****'
+            elif isinstance(value, dict):
+                target[key] = _copy_of(value)
+            elif isinstance(value, list):
+                target[key] = [
+                    _copy_of(item) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            else:
+                target[key] = value
     return masked
 
 
@@ -151,7 +225,8 @@ def validate_json_size(value: Any, max_bytes: int, field_name: str) -> Any:
         payload = json.dumps(value, ensure_ascii=True)
     except (TypeError, ValueError):
         raise ValueError(f'Campo {field_name} possui JSON invalido')
-    if len(payload.encode('utf-8')) > max_bytes:
+    # Com ensure_ascii=True o JSON e puro ASCII: len() == tamanho em bytes
+    if len(payload) > max_bytes:
         raise ValueError(
             f'Campo {field_name} excede o limite de {max_bytes // 1024}KB'
         )
@@ -164,17 +239,17 @@ def validate_password_strength(password: str) -> str:
     """
     if len(password) < 12:
         raise ValueError('A senha deve ter pelo menos 12 caracteres')
-    if not re.search(r'[A-Z]', password):
+    if not _UPPER_RE.search(password):
         raise ValueError('A senha deve conter pelo menos 1 letra maiuscula')
-    if not re.search(r'[a-z]', password):
+    if not _LOWER_RE.search(password):
         raise ValueError('A senha deve conter pelo menos 1 letra minuscula')
-    if not re.search(r'\d', password):
+    if not _DIGIT_RE.search(password):
         raise ValueError('A senha deve conter pelo menos 1 numero')
-    if not re.search(r'[^A-Za-z0-9]', password):
+    if not _SPECIAL_RE.search(password):
         raise ValueError('A senha deve conter pelo menos 1 caractere especial')
 
     lowered = password.lower()
-    if lowered in get_common_passwords():
+    if lowered in _COMMON_PASSWORDS:
         raise ValueError('A senha informada e muito comum')
 
     return password
@@ -1,7 +1,11 @@
+import asyncio
+import functools
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.config import settings
@@ -9,6 +13,59 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _endpoint_url(endpoint: str) -> str:
+    """Monta a URL do endpoint (aceita 'host:porta' ou URL completa)."""
+    if endpoint.startswith(('http://', 'https://')):
+        return endpoint
+    return f'{"https" if settings.minio_use_ssl else "http"}://{endpoint}'
+
+
+@functools.cache
+def _get_s3_client() -> Any:
+    """
+    Retorna o cliente boto3 do MinIO, criado uma vez por processo.
+
+    Criar um cliente boto3 e caro (carrega os modelos de servico do
+    botocore); o cliente e thread-safe e mantem um pool de conexoes
+    HTTP keep-alive compartilhado por todas as instancias de StorageClient.
+    """
+    # Sessao propria: criar clientes a partir da sessao padrao nao e thread-safe
+    return boto3.session.Session().client(
+        's3',
+        endpoint_url=_endpoint_url(settings.minio_endpoint),
+        aws_access_key_id=settings.minio_access_key,
+        aws_secret_access_key=settings.minio_secret_key,
+        region_name='us-east-1',
+        config=Config(
+            max_pool_connections=50,
+            retries={'max_attempts': 3, 'mode': 'standard'},
+            tcp_keepalive=True,
+        ),
+    )
+
+
+@functools.cache
+def _get_presign_client() -> Any:
+    """
+    Retorna o cliente usado para gerar URLs presigned.
+
+    Com MINIO_PUBLIC_ENDPOINT configurado, e um cliente dedicado apontando
+    para o endpoint publico (acessivel pelo browser). Assinar nao faz
+    chamadas de rede, entao esse endpoint nao precisa ser alcancavel de
+    dentro do container. Sem ele, reutiliza o cliente principal.
+    """
+    if not settings.minio_public_endpoint:
+        return _get_s3_client()
+    return boto3.session.Session().client(
+        's3',
+        endpoint_url=_endpoint_url(settings.minio_public_endpoint),
+        aws_access_key_id=settings.minio_access_key,
+        aws_secret_access_key=settings.minio_secret_key,
+        region_name='us-east-1',
+        config=Config(signature_version='s3v4', s3={'addressing_style': 'path'}),
+    )
+
+
 class StorageClient:
     """
     Cliente para MinIO/S3 usando boto3.
@@ -18,14 +75,9 @@ class StorageClient:
     """
 
     def __init__(self) -> None:
-        """Inicializa o cliente boto3 com as configuracoes do MinIO."""
-        self._client = boto3.client(
-            's3',
-            endpoint_url=f'{"https" if settings.minio_use_ssl else "http"}://{settings.minio_endpoint}',
-            aws_access_key_id=settings.minio_access_key,
-            aws_secret_access_key=settings.minio_secret_key,
-            region_name='us-east-1',
-        )
+        """Inicializa com os clientes boto3 compartilhados do processo."""
+        self._client = _get_s3_client()
+        self._presign_client = _get_presign_client()
         self._bucket = settings.minio_bucket
 
     def ensure_bucket_exists(self) -> None:
@@ -158,6 +210,31 @@ class StorageClient:
             logger.error('Erro ao baixar arquivo %s: %s', key, e)
             raise
 
+    async def upload_file_async(
+        self,
+        key: str,
+        file_data: bytes,
+        content_type: str = 'application/octet-stream',
+        bucket: str | None = None,
+    ) -> str:
+        """
+        Versao assincrona de upload_file para handlers async.
+
+        Executa a chamada boto3 (bloqueante) em uma thread, liberando o
+        event loop durante o round-trip com o MinIO.
+        """
+        return await asyncio.to_thread(
+            self.upload_file, key, file_data, content_type, bucket,
+        )
+
+    async def download_file_async(
+        self,
+        key: str,
+        bucket: str | None = None,
+    ) -> bytes:
+        """Versao assincrona de download_file (executada em thread)."""
+        return await asyncio.to_thread(self.download_file, key, bucket)
+
     def get_presigned_url(
         self,
         key: str,
@@ -167,9 +244,9 @@ class StorageClient:
         """
         Gera uma URL presigned para acesso temporario ao arquivo.
 
-        Quando MINIO_PUBLIC_ENDPOINT esta configurado, substitui o endpoint
-        interno (Docker) pelo endpoint publico na URL gerada, permitindo
-        acesso pelo browser do usuario.
+        Quando MINIO_PUBLIC_ENDPOINT esta configurado, a URL e assinada
+        diretamente para o endpoint publico, permitindo acesso pelo browser
+        do usuario (ex: localhost:9000 em vez de minio:9000).
 
         Args:
             key: Caminho/nome do arquivo no bucket.
@@ -181,7 +258,7 @@ class StorageClient:
         """
         target_bucket = bucket or self._bucket
         try:
-            url: str = self._client.generate_presigned_url(
+            url: str = self._presign_client.generate_presigned_url(
                 'get_object',
                 Params={
                     'Bucket': target_bucket,
@@ -189,14 +266,6 @@ class StorageClient:
                 },
                 ExpiresIn=expiration,
             )
-
-            # Substitui o endpoint interno pelo publico para que o browser
-            # do usuario consiga acessar a URL (ex: minio:9000 -> localhost:9000)
-            public_endpoint = settings.minio_public_endpoint
-            if public_endpoint:
-                internal_endpoint = settings.minio_endpoint
-                url = url.replace(internal_endpoint, public_endpoint, 1)
-
             return url
         except ClientError as e:
             logger.error('Erro ao gerar URL presigned para %s: %s', key, e)
@@ -225,31 +294,43 @@ class StorageClient:
             logger.error('Erro ao excluir arquivo %s: %s', key, e)
             raise
 
+    async def delete_file_async(
+        self,
+        key: str,
+        bucket: str | None = None,
+    ) -> None:
+        """Versao assincrona de delete_file (executada em thread)."""
+        await asyncio.to_thread(self.delete_file, key, bucket)
+
     def list_files(
         self,
         prefix: str = '',
         bucket: str | None = None,
-    ) -> list[str]:
+    ) -> Iterator[str]:
         """
         Lista arquivos no storage com um prefixo.
 
+        Percorre todas as paginas de list_objects_v2 (sem o limite de 1000
+        chaves de uma unica chamada) e retorna as chaves sob demanda.
+        Quem precisar de uma lista deve usar list(...).
+
         Args:
             prefix: Prefixo para filtrar arquivos.
             bucket: Nome do bucket (usa padrao se nao informado).
 
         Returns:
-            Lista de caminhos dos arquivos encontrados.
+            Iterador com os caminhos dos arquivos encontrados.
         """
         target_bucket = bucket or self._bucket
+        paginator = self._client.get_paginator('list_objects_v2')
         try:
-            response = self._client.list_objects_v2(
+            for page in paginator.paginate(
                 Bucket=target_bucket,
                 Prefix=prefix,
-            )
-            files: list[str] = []
-            for obj in response.get('Contents', []):
-                files.append(obj['Key'])
-            return files
+                PaginationConfig={'PageSize': 1000},
+            ):
+                for obj in page.get('Contents', []):
+                    yield obj['Key']
         except ClientError as e:
             logger.error('Erro ao listar arquivos com prefixo %s: %s', prefix, e)
             raise
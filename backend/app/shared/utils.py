@@ -1,15 +1,21 @@
+import functools
 import json
 import uuid
 from datetime import UTC, datetime
 
+import orjson
 from cryptography.fernet import Fernet, InvalidToken, MultiFernet
 
 from app.config import settings
 
+# Aceita chaves nao-string (ex: int), como o json.dumps da stdlib
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
-def _get_fernet_keys() -> list[bytes]:
+
+@functools.cache
+def _get_fernet_keys() -> tuple[bytes, ...]:
     """
-    Retorna a lista de chaves Fernet configuradas.
+    Retorna as chaves Fernet configuradas (calculadas uma vez por processo).
 
     Suporta rotacao de chaves via ENCRYPTION_KEYS (lista separada por virgula).
     A primeira chave e usada para criptografar; todas sao usadas para descriptografar.
@@ -23,16 +29,37 @@ def _get_fernet_keys() -> list[bytes]:
                 keys.append(cleaned.encode('utf-8'))
     if not keys:
         keys.append(settings.encryption_key.encode('utf-8'))
-    return keys
+    return tuple(keys)
 
 
+@functools.cache
 def get_fernet() -> MultiFernet:
-    """Retorna uma instancia MultiFernet com todas as chaves configuradas."""
+    """
+    Retorna a instancia MultiFernet com todas as chaves configuradas.
+
+    A instancia e criada uma vez por processo e compartilhada (MultiFernet
+    nao guarda estado entre chamadas). As chaves vem das configuracoes
+    carregadas no startup; a troca de chaves exige reiniciar o processo.
+    """
     keys = _get_fernet_keys()
     fernets = [Fernet(key) for key in keys]
     return MultiFernet(fernets)
 
 
+def encrypt_bytes(data: bytes) -> str:
+    """
+    Criptografa bytes usando Fernet.
+
+    Args:
+        data: Conteudo em bytes para criptografar.
+
+    Returns:
+        Valor criptografado em formato string (base64).
+    """
+    # Tokens Fernet sao base64 url-safe (apenas ASCII)
+    return get_fernet().encrypt(data).decode('ascii')
+
+
 def encrypt_value(value: str) -> str:
     """
     Criptografa um valor usando Fernet.
@@ -43,9 +70,7 @@ def encrypt_value(value: str) -> str:
     Returns:
         Valor criptografado em formato string (base64).
     """
-    fernet = get_fernet()
-    encrypted: bytes = fernet.encrypt(value.encode('utf-8'))
-    return encrypted.decode('utf-8')
+    return encrypt_bytes(value.encode('utf-8'))
 
 
 def decrypt_value(encrypted_value: str) -> str:
@@ -66,20 +91,69 @@ def decrypt_value(encrypted_value: str) -> str:
     return decrypted.decode('utf-8')
 
 
+def encrypt_many(values: list[str]) -> list[str]:
+    """
+    Criptografa varios valores com encrypt_bytes.
+
+    Args:
+        values: Valores em texto puro para criptografar.
+
+    Returns:
+        Valores criptografados (base64), na mesma ordem da entrada.
+    """
+    return [encrypt_bytes(value.encode('utf-8')) for value in values]
+
+
+def decrypt_many(encrypted_values: list[str]) -> list[str | None]:
+    """
+    Descriptografa varios valores reutilizando a mesma instancia Fernet.
+
+    Diferente de decrypt_value, nao interrompe o lote em caso de falha:
+    valores que nao puderem ser descriptografados retornam None.
+
+    Args:
+        encrypted_values: Valores criptografados (base64).
+
+    Returns:
+        Valores em texto puro (ou None), na mesma ordem da entrada.
+    """
+    fernet = get_fernet()
+    decrypted: list[str | None] = []
+    for encrypted_value in encrypted_values:
+        try:
+            decrypted.append(fernet.decrypt(encrypted_value.encode('utf-8')).decode('utf-8'))
+        except (InvalidToken, ValueError):
+            decrypted.append(None)
+    return decrypted
+
+
 def encrypt_dict(value: dict) -> str:
     """
     Criptografa um dicionario como JSON.
+
+    Serializa com orjson direto para bytes. Valores que o orjson nao
+    suporta (ex: inteiros acima de 64 bits) caem no json da stdlib.
     """
-    payload = json.dumps(value, ensure_ascii=True)
-    return encrypt_value(payload)
+    try:
+        return encrypt_bytes(orjson.dumps(value, option=_ORJSON_OPTIONS))
+    except orjson.JSONEncodeError:
+        pass
+    return encrypt_bytes(json.dumps(value, ensure_ascii=True).encode('ascii'))
 
 
 def decrypt_dict(encrypted_value: str) -> dict:
     """
     Descriptografa um JSON criptografado e retorna dict.
+
+    Le tanto payloads gravados com orjson (UTF-8) quanto os antigos do
+    json da stdlib (ASCII com escapes). Payloads antigos que o orjson
+    rejeita (ex: NaN gravado pelo json.dumps) sao lidos pelo json da stdlib.
     """
-    decrypted = decrypt_value(encrypted_value)
-    return json.loads(decrypted)
+    decrypted: bytes = get_fernet().decrypt(encrypted_value.encode('ascii'))
+    try:
+        return orjson.loads(decrypted)
+    except orjson.JSONDecodeError:
+        return json.loads(decrypted)
 
 
 def generate_uuid() -> uuid.UUID:
@@ -7,57 +7,168 @@ Uso:
 IMPORTANTE:
 - A primeira chave de ENCRYPTION_KEYS sera usada para criptografar.
 - As demais chaves serao usadas apenas para descriptografar.
+- Os registros sao processados e confirmados em lotes. Se o script falhar
+  no meio, basta executa-lo novamente: valores ja rotacionados continuam
+  legiveis com a nova chave e sao apenas recriptografados.
 """
 
+import functools
+import os
 import sys
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from cryptography.fernet import MultiFernet
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
 from app.modules.delivery.models import DeliveryConfig
 from app.modules.projects.models import Project
 from app.modules.settings.models import Setting
-from app.shared.utils import decrypt_value, encrypt_value
+from app.shared.utils import get_fernet
+
+# Quantidade de registros lidos e atualizados por lote
+_BATCH_SIZE = 2000
+
+# Quantidade de valores recriptografados por tarefa do pool de threads
+_CHUNK_SIZE = 256
+
+# A cryptography libera o GIL durante AES/HMAC no OpenSSL, entao threads
+# escalam com o numero de nucleos sem o custo de serializar para processos
+_MAX_WORKERS = os.cpu_count() or 1
+
+
+def _reencrypt(fernet: MultiFernet, value: str) -> str:
+    """Descriptografa (com qualquer chave) e recriptografa com a chave atual."""
+    return fernet.rotate(value.encode('utf-8')).decode('utf-8')
+
+
+def _reencrypt_chunk(fernet: MultiFernet, values: Sequence[str]) -> list[str]:
+    """Recriptografa uma sequencia de valores (unidade de trabalho do pool)."""
+    return [_reencrypt(fernet, value) for value in values]
 
 
-def _reencrypt(value: str) -> str:
-    """Descriptografa e recriptografa com a chave atual."""
-    decrypted = decrypt_value(value)
-    return encrypt_value(decrypted)
+def _reencrypt_many(
+    fernet: MultiFernet,
+    values: list[str],
+    executor: ThreadPoolExecutor | None,
+) -> list[str]:
+    """
+    Recriptografa os valores, em paralelo quando ha um executor.
+
+    Os valores sao agrupados em blocos de _CHUNK_SIZE para amortizar o
+    custo de agendamento de cada tarefa. A ordem de saida e preservada.
+    """
+    if executor is None or len(values) <= _CHUNK_SIZE:
+        return _reencrypt_chunk(fernet, values)
+    chunks = (
+        values[start:start + _CHUNK_SIZE]
+        for start in range(0, len(values), _CHUNK_SIZE)
+    )
+    results = executor.map(functools.partial(_reencrypt_chunk, fernet), chunks)
+    return [value for chunk in results for value in chunk]
+
+
+def _rotate_table(
+    db: Session,
+    fernet: MultiFernet,
+    table: str,
+    columns: tuple[str, ...],
+    executor: ThreadPoolExecutor | None = None,
+) -> int:
+    """
+    Recriptografa as colunas informadas de uma tabela, em lotes.
+
+    A leitura usa uma conexao separada com cursor no servidor
+    (stream_results), que nao e afetada pelos commits de cada lote.
+    As escritas sao UPDATEs parametrizados enviados em executemany pela
+    sessao, sem passar pelo unit of work do ORM. A memoria fica limitada
+    ao tamanho do lote, independente do tamanho da tabela. Com um executor,
+    a recriptografia de cada lote e distribuida entre threads.
+
+    Returns:
+        Quantidade de valores recriptografados.
+    """
+    # Identificadores fixos definidos em rotate_keys (nao vem de entrada externa)
+    select_stmt = text(
+        f'SELECT id, {", ".join(columns)} FROM {table} '
+        f'WHERE {" OR ".join(f"{column} IS NOT NULL" for column in columns)}'
+    )
+    update_stmts = {
+        column: text(f'UPDATE {table} SET {column} = :value WHERE id = :id')
+        for column in columns
+    }
+
+    updated = 0
+    with db.get_bind().connect() as reader:
+        result = reader.execution_options(
+            stream_results=True,
+            yield_per=_BATCH_SIZE,
+        ).execute(select_stmt)
+        for batch in result.partitions():
+            for index, column in enumerate(columns, start=1):
+                rows = [(row[0], row[index]) for row in batch if row[index]]
+                if not rows:
+                    continue
+                new_values = _reencrypt_many(
+                    fernet,
+                    [value for _, value in rows],
+                    executor,
+                )
+                db.execute(
+                    update_stmts[column],
+                    [
+                        {'id': row_id, 'value': value}
+                        for (row_id, _), value in zip(rows, new_values)
+                    ],
+                )
+                updated += len(rows)
+            db.commit()
+
+    return updated
 
 
 def rotate_keys() -> None:
     """Recriptografa todos os valores sensiveis com a chave atual."""
     db = SessionLocal()
+    executor = (
+        ThreadPoolExecutor(max_workers=_MAX_WORKERS) if _MAX_WORKERS > 1 else None
+    )
     try:
+        fernet = get_fernet()
         updated = 0
 
-        settings = db.query(Setting).all()
-        for setting in settings:
-            if setting.encrypted_value:
-                setting.encrypted_value = _reencrypt(setting.encrypted_value)
-                updated += 1
-
-        projects = db.query(Project).all()
-        for project in projects:
-            if project.encrypted_credentials:
-                project.encrypted_credentials = _reencrypt(project.encrypted_credentials)
-                updated += 1
-            if project.encrypted_llm_api_key:
-                project.encrypted_llm_api_key = _reencrypt(project.encrypted_llm_api_key)
-                updated += 1
-
-        configs = db.query(DeliveryConfig).all()
-        for config in configs:
-            if config.channel_config:
-                config.channel_config = _reencrypt(config.channel_config)
-                updated += 1
-
-        db.commit()
+        updated += _rotate_table(
+            db,
+            fernet,
+            Setting.__tablename__,
+            ('encrypted_value',),
+            executor,
+        )
+        updated += _rotate_table(
+            db,
+            fernet,
+            Project.__tablename__,
+            ('encrypted_credentials', 'encrypted_llm_api_key'),
+            executor,
+        )
+        updated += _rotate_table(
+            db,
+            fernet,
+            DeliveryConfig.__tablename__,
+            ('channel_config',),
+            executor,
+        )
+
         print(f'Rotacao concluida. Registros atualizados: {updated}')
     except Exception as exc:
         db.rollback()
         print(f'Erro na rotacao de chaves: {exc}', file=sys.stderr)
         sys.exit(1)
     finally:
+        if executor is not None:
+            executor.shutdown()
         db.close()
 
 
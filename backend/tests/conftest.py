@@ -0,0 +1,44 @@
+"""
+Fixtures compartilhadas dos testes do backend.
+
+Os testes de repositorio usam SQLite em memoria. Colunas exclusivas do
+PostgreSQL (ex: search_vector/tsvector gerada) viram colunas TEXT simples.
+"""
+
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, Text, create_engine
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.modules.delivery.models import DeliveryConfig
+from app.modules.executions.models import Execution
+from app.modules.jobs.models import Job
+from app.modules.projects.models import Project
+from app.modules.prompts.models import PromptTemplate
+
+
+def _create_sqlite_table(table: Table, engine) -> None:
+    """Cria a tabela no SQLite trocando colunas tsvector por TEXT."""
+    columns = [
+        Column(column.name, Text, nullable=True)
+        if isinstance(column.type, TSVECTOR)
+        else column._copy()
+        for column in table.columns
+    ]
+    Table(table.name, MetaData(), *columns).create(engine)
+
+
+@pytest.fixture
+def db() -> Generator[Session, None, None]:
+    """Sessao SQLite em memoria com as tabelas usadas pelos testes."""
+    engine = create_engine('sqlite://')
+    for model in (Project, Job, DeliveryConfig, Execution, PromptTemplate):
+        _create_sqlite_table(model.__table__, engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
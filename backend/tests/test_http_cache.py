@@ -0,0 +1,47 @@
+"""Testes das requisicoes condicionais (ETag / If-Modified-Since)."""
+
+from datetime import UTC, datetime
+
+from starlette.requests import Request
+
+from app.shared.http_cache import is_not_modified
+
+_ETAG = '"abc"'
+_LAST_MODIFIED = datetime(2026, 10, 16, 19, 0, 0, 500000, tzinfo=UTC)
+
+
+def _request(**headers: str) -> Request:
+    """Cria uma Request com os headers informados."""
+    raw = [(name.replace('_', '-').encode(), value.encode()) for name, value in headers.items()]
+    return Request({'type': 'http', 'headers': raw})
+
+
+def test_if_none_match_takes_precedence() -> None:
+    request = _request(
+        if_none_match='W/"abc"',
+        if_modified_since='Thu, 01 Jan 2026 00:00:00 GMT',
+    )
+    assert is_not_modified(request, _ETAG, _LAST_MODIFIED)
+
+
+def test_if_modified_since_with_timezone() -> None:
+    request = _request(if_modified_since='Fri, 16 Oct 2026 19:00:00 GMT')
+    assert is_not_modified(request, _ETAG, _LAST_MODIFIED)
+
+
+def test_if_modified_since_without_timezone_is_treated_as_utc() -> None:
+    assert is_not_modified(
+        _request(if_modified_since='Fri, 16 Oct 2026 19:00:00'),
+        _ETAG,
+        _LAST_MODIFIED,
+    )
+    assert not is_not_modified(
+        _request(if_modified_since='Fri, 16 Oct 2026 18:59:59 -0000'),
+        _ETAG,
+        _LAST_MODIFIED,
+    )
+
+
+def test_invalid_if_modified_since_is_ignored() -> None:
+    request = _request(if_modified_since='not a date')
+    assert not is_not_modified(request, _ETAG, _LAST_MODIFIED)
@@ -0,0 +1,62 @@
+"""Testes do PromptTemplateRepository (lambda_stmt e soft delete)."""
+
+from sqlalchemy.orm import Session
+
+from app.modules.prompts.models import PromptTemplate
+from app.modules.prompts.repository import PromptTemplateRepository
+from app.shared.utils import utc_now
+
+
+def _seed(db: Session) -> None:
+    """Cria templates 'alpha' (3) e 'beta' (2), mais um 'beta' excluido."""
+    for index in range(3):
+        db.add(PromptTemplate(name=f'alpha {index}', content='x', category='c-alpha'))
+    for index in range(2):
+        db.add(PromptTemplate(name=f'beta {index}', content='x', category='c-beta'))
+    db.add(PromptTemplate(
+        name='beta removido',
+        content='x',
+        category='c-beta',
+        deleted_at=utc_now(),
+    ))
+    db.commit()
+
+
+def test_get_all_binds_new_filters_on_each_call(db: Session) -> None:
+    _seed(db)
+    repository = PromptTemplateRepository(db)
+
+    items, total = repository.get_all(search='alpha', category='c-alpha')
+    assert total == 3
+    assert {item.name for item in items} == {'alpha 0', 'alpha 1', 'alpha 2'}
+
+    items, total = repository.get_all(search='beta', category='c-beta')
+    assert total == 2
+    assert {item.name for item in items} == {'beta 0', 'beta 1'}
+
+
+def test_get_all_binds_new_page_on_each_call(db: Session) -> None:
+    _seed(db)
+    repository = PromptTemplateRepository(db)
+
+    first, _ = repository.get_all(page=1, per_page=2, include_content=False)
+    first_ids = [row.id for row in first]
+    third, total = repository.get_all(page=3, per_page=2, include_content=False)
+    third_ids = [row.id for row in third]
+
+    assert total == 5
+    assert len(first_ids) == 2
+    assert len(third_ids) == 1
+    assert not set(first_ids) & set(third_ids)
+
+
+def test_get_list_stats_binds_new_filters_on_each_call(db: Session) -> None:
+    _seed(db)
+    repository = PromptTemplateRepository(db)
+
+    total, _ = repository.get_list_stats(search='alpha')
+    assert total == 3
+
+    total, last_modified = repository.get_list_stats(search='beta')
+    assert total == 2
+    assert last_modified is not None
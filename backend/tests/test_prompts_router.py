@@ -0,0 +1,68 @@
+"""Testes das requisicoes condicionais da listagem de templates."""
+
+from email.utils import format_datetime
+
+from fastapi import Response
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from app.modules.prompts.models import PromptTemplate
+from app.modules.prompts.repository import PromptTemplateRepository
+from app.modules.prompts.router import list_templates
+from app.modules.prompts.service import PromptTemplateService
+from app.shared.utils import utc_now
+
+
+def _request(**headers: str) -> Request:
+    """Cria uma Request com os headers informados."""
+    raw = [(name.replace('_', '-').encode(), value.encode()) for name, value in headers.items()]
+    return Request({'type': 'http', 'headers': raw})
+
+
+def _list(db: Session, request: Request, response: Response):
+    """Chama o endpoint de listagem com os parametros padrao."""
+    return list_templates(
+        request=request,
+        response=response,
+        page=1,
+        per_page=20,
+        search=None,
+        category=None,
+        search_fulltext=None,
+        include_content=True,
+        current_user=None,
+        service=PromptTemplateService(PromptTemplateRepository(db)),
+    )
+
+
+def test_list_after_delete_ignores_if_modified_since(db: Session) -> None:
+    templates = [PromptTemplate(name=f't{index}', content='x') for index in range(2)]
+    db.add_all(templates)
+    db.commit()
+
+    response = Response()
+    _list(db, _request(), response)
+    assert 'last-modified' not in response.headers
+    etag = response.headers['etag']
+    seen_at = format_datetime(utc_now(), usegmt=True)
+
+    PromptTemplateService(PromptTemplateRepository(db)).delete_template(templates[0].id)
+    db.commit()
+
+    result = _list(db, _request(if_modified_since=seen_at), Response())
+    assert result.total == 1
+
+    response = Response()
+    _list(db, _request(if_none_match=etag), response)
+    assert response.headers['etag'] != etag
+
+
+def test_list_unchanged_returns_304_for_matching_etag(db: Session) -> None:
+    db.add(PromptTemplate(name='t', content='x'))
+    db.commit()
+
+    response = Response()
+    _list(db, _request(), response)
+
+    result = _list(db, _request(if_none_match=response.headers['etag']), Response())
+    assert result.status_code == 304
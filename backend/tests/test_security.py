@@ -0,0 +1,83 @@
+"""Testes dos utilitarios de seguranca (mascaramento de chaves sensiveis)."""
+
+import pytest
+
+from app.shared.security import mask_sensitive_dict, sanitize_string_dict
+
+
+@pytest.mark.parametrize(
+    'key',
+    [
+        'password',
+        'smtp_password',
+        'SMTP_PASSWORD',
+        'passwordhash',
+        'passwords',
+        'secretvalue',
+        'clientSecret',
+        'webhook_secret',
+        'token',
+        'auth_token',
+        'accessToken',
+        'tokenkey',
+        'x_tokenvalue',
+        'tokenized',
+        'api_key',
+        'apiKey',
+        'X-Api-Key',
+        'aws_secret_access_key',
+        'private_key',
+    ],
+)
+def test_mask_sensitive_dict_masks_sensitive_keys(key: str) -> None:
+    assert mask_sensitive_dict({key: 'valor'}) == {key: '****'}
+
+
+@pytest.mark.parametrize(
+    'key',
+    [
+        'max_tokens',
+        'input_tokens',
+        'output_tokens',
+        'total_tokens',
+        'tokens_used',
+        'token_budget',
+        'prompt_token_count',
+        'smtp_host',
+        'smtp_port',
+    ],
+)
+def test_mask_sensitive_dict_keeps_non_sensitive_keys(key: str) -> None:
+    assert mask_sensitive_dict({key: 100}) == {key: 100}
+
+
+def test_mask_sensitive_dict_masks_nested_keys() -> None:
+    data = {'llm': {'api_key': 'k', 'max_tokens': 10}, 'items': [{'token': 't'}]}
+    assert mask_sensitive_dict(data) == {
+        'llm': {'api_key': '****', 'max_tokens': 10},
+        'items': [{'token': '****'}],
+    }
+
+
+def test_mask_sensitive_dict_handles_cyclic_references() -> None:
+    data: dict = {'password': 'x', 'items': []}
+    data['self'] = data
+    data['items'].append(data)
+
+    masked = mask_sensitive_dict(data)
+
+    assert masked['password'] == '****'
+    assert masked['self'] is masked
+    assert masked['items'][0] is masked
+
+
+def test_sanitize_string_dict_handles_cyclic_references() -> None:
+    child: dict = {'name': ' valor\x00 '}
+    data: dict = {'child': child, 'list': [child]}
+    child['parent'] = data
+
+    cleaned = sanitize_string_dict(data)
+
+    assert cleaned['child']['name'] == 'valor'
+    assert cleaned['child']['parent'] is cleaned
+    assert cleaned['list'][0] is cleaned['child']
@@ -0,0 +1,91 @@
+"""Testes do filtro automatico de soft delete (do_orm_execute)."""
+
+from datetime import timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.modules.dashboard.service import DashboardService
+from app.modules.executions.models import Execution
+from app.modules.jobs.models import Job
+from app.modules.jobs.repository import JobRepository
+from app.modules.projects.models import Project
+from app.shared.models import INCLUDE_DELETED
+from app.shared.utils import utc_now
+
+
+def _seed(db: Session) -> tuple[Job, Job]:
+    """Cria um job vivo e um excluido, cada um com uma execucao de sucesso."""
+    project = Project(
+        name='projeto',
+        base_url='https://example.com',
+        llm_provider='openai',
+        llm_model='gpt-4o',
+    )
+    db.add(project)
+    db.flush()
+
+    alive = Job(
+        project_id=project.id,
+        name='job vivo',
+        cron_expression='* * * * *',
+        agent_prompt='x',
+    )
+    deleted = Job(
+        project_id=project.id,
+        name='job removido',
+        cron_expression='* * * * *',
+        agent_prompt='x',
+        deleted_at=utc_now(),
+    )
+    db.add_all([alive, deleted])
+    db.flush()
+
+    for job, duration in ((alive, 10), (deleted, 20)):
+        db.add(Execution(job_id=job.id, status='success', duration_seconds=duration))
+    db.commit()
+    return alive, deleted
+
+
+def test_entity_select_excludes_deleted_rows(db: Session) -> None:
+    alive, deleted = _seed(db)
+
+    jobs = db.execute(select(Job)).scalars().all()
+    assert [job.id for job in jobs] == [alive.id]
+
+    stmt = select(Job).where(Job.id == deleted.id)
+    assert db.execute(stmt).scalar_one_or_none() is None
+    assert db.execute(
+        stmt, execution_options={INCLUDE_DELETED: True},
+    ).scalar_one() == deleted
+
+
+def test_column_select_joined_to_deleted_parent_keeps_rows(db: Session) -> None:
+    _seed(db)
+
+    stmt = select(Execution.duration_seconds, Job.name).join(
+        Job, Execution.job_id == Job.id,
+    )
+    rows = db.execute(stmt).all()
+
+    assert {row.name for row in rows} == {'job vivo', 'job removido'}
+
+
+def test_duration_by_job_counts_deleted_jobs(db: Session) -> None:
+    _seed(db)
+    now = utc_now()
+
+    ranking = DashboardService(db)._get_duration_by_job(
+        now - timedelta(days=1), now + timedelta(days=1),
+    )
+
+    assert [item.job_name for item in ranking] == ['job removido', 'job vivo']
+
+
+def test_job_counts_ignore_deleted_rows(db: Session) -> None:
+    _seed(db)
+    repository = JobRepository(db)
+
+    _, total = repository.get_all()
+    assert total == 1
+    assert repository.count_active() == 1